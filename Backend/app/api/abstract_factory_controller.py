@@ -2,23 +2,38 @@
 Controlador para el patrón Abstract Factory.
 Demuestra el uso del Abstract Factory para crear familias de productos de cloud.
 """
-from fastapi import APIRouter, Depends, HTTPException
-from typing import Dict, Any, Optional, List
+import asyncio
+import logging
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from typing import Dict, Any, Optional, List, Tuple
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
+from types import MappingProxyType
 from uuid import uuid4
-from datetime import datetime
-from pydantic import BaseModel, Field
+from datetime import datetime, timezone
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+import orjson
 
 from app.domain.factory_provider import (
     create_cloud_factory,
-    get_available_providers,
+    get_available_provider_codes,
     CloudProvider
 )
-from app.domain.abstractions.factory import CloudResourceManager
+from app.domain.abstractions.factory import CloudAbstractFactory, CloudResourceManager
+from app.domain.abstractions.products import CloudResource
 from app.core.container import get_vm_service
 from app.domain.services import VMService
-from app.infrastructure.logger import audit_log
+from app.infrastructure.logger import audit_queue
+from app.core.config import VALIDATE_API_RESPONSE
+from app.core.responses import json_response
+from app.core.http_cache import StaticJSON, static_json, static_json_response
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
 class InfrastructureCreateRequest(BaseModel):
@@ -26,55 +41,50 @@ class InfrastructureCreateRequest(BaseModel):
     provider: str = Field(..., description="Proveedor de cloud (aws, azure, gcp, oracle, onprem)")
     name: str = Field(..., description="Nombre de la infraestructura")
     region: Optional[str] = Field("us-east-1", description="Región donde crear la infraestructura")
-    vm_config: Optional[Dict[str, Any]] = Field(None, description="Configuración de VM")
-    database_config: Optional[Dict[str, Any]] = Field(None, description="Configuración de base de datos") 
-    load_balancer_config: Optional[Dict[str, Any]] = Field(None, description="Configuración de load balancer")
-    storage_config: Optional[Dict[str, Any]] = Field(None, description="Configuración de almacenamiento")
+    # Configs libres: se exige un objeto JSON pero no se valida clave a clave
+    vm_config: Optional[dict] = Field(None, description="Configuración de VM")
+    database_config: Optional[dict] = Field(None, description="Configuración de base de datos")
+    load_balancer_config: Optional[dict] = Field(None, description="Configuración de load balancer")
+    storage_config: Optional[dict] = Field(None, description="Configuración de almacenamiento")
     include_database: Optional[bool] = Field(True, description="Incluir base de datos")
     include_load_balancer: Optional[bool] = Field(True, description="Incluir load balancer")
     include_storage: Optional[bool] = Field(True, description="Incluir almacenamiento")
     requested_by: Optional[str] = Field("system", description="Usuario que solicita la creación")
 
-    class Config:
-        schema_extra = {
+    # Config v2: validación en el core de Rust sin pasos extra por asignación ni por cadena
+    model_config = ConfigDict(
+        extra="ignore",
+        validate_assignment=False,
+        str_strip_whitespace=False,
+        json_schema_extra={
             "example": {
                 "provider": "aws",
-                "vm": {
-                    "name": "web-server-vm",
-                    "config": {
-                        "instance_type": "t3.micro",
-                        "ami": "ami-0abcdef1234567890",
-                        "vpc_id": "vpc-12345",
-                        "region": "us-east-1"
-                    }
+                "name": "web-app",
+                "region": "us-east-1",
+                "vm_config": {
+                    "instance_type": "t3.micro",
+                    "ami": "ami-0abcdef1234567890",
+                    "vpc_id": "vpc-12345"
                 },
-                "database": {
-                    "name": "app-database",
-                    "config": {
-                        "engine": "mysql",
-                        "instance_class": "db.t3.micro",
-                        "allocated_storage": 20,
-                        "region": "us-east-1"
-                    }
+                "database_config": {
+                    "engine": "mysql",
+                    "instance_class": "db.t3.micro",
+                    "allocated_storage": 20,
+                    "region": "us-east-1"
                 },
-                "load_balancer": {
-                    "name": "web-lb",
-                    "config": {
-                        "vpc_id": "vpc-12345",
-                        "region": "us-east-1",
-                        "scheme": "internet-facing"
-                    }
+                "load_balancer_config": {
+                    "vpc_id": "vpc-12345",
+                    "region": "us-east-1",
+                    "scheme": "internet-facing"
                 },
-                "storage": {
-                    "name": "app-storage-bucket",
-                    "config": {
-                        "region": "us-east-1",
-                        "storage_class": "STANDARD"
-                    }
+                "storage_config": {
+                    "region": "us-east-1",
+                    "storage_class": "STANDARD"
                 },
                 "requested_by": "admin"
             }
         }
+    )
 
 
 class InfrastructureResponse(BaseModel):
@@ -115,9 +125,11 @@ class InfrastructureUpdateRequest(BaseModel):
 
 
 class InfrastructureListResponse(BaseModel):
-    """Listado de infraestructuras"""
+    """Listado paginado de infraestructuras"""
     total: int
     items: List[InfrastructureRecord]
+    page: int
+    page_size: int
 
 
 class InfrastructureDeleteResponse(BaseModel):
@@ -126,252 +138,318 @@ class InfrastructureDeleteResponse(BaseModel):
     infrastructure_id: str
 
 
+# Prefijo de los IDs de infraestructura: prefijo + uuid4().hex (sin guiones)
+_INFRA_ID_PREFIX = "infra-"
+
+
 # Repositorio en memoria (simple singleton en este módulo)
 class _InfrastructureRepository:
+    """
+    Registros activos y eliminados en diccionarios separados: el listado es
+    O(activos) y el soft-delete mueve el registro de uno a otro. Un índice
+    secundario por proveedor permite filtrar sin recorrer el resto. Sin lock: todos
+    los accesos se hacen desde handlers async en el event loop y ningún método
+    cede el control a mitad de una mutación.
+    Nota: el estado es por proceso; con varios workers cada uno tiene el suyo.
+    """
+
     def __init__(self):
-        self._store: Dict[str, InfrastructureRecord] = {}
+        self._active: Dict[str, InfrastructureRecord] = {}
+        self._deleted: Dict[str, InfrastructureRecord] = {}
+        # proveedor (minúsculas) -> registros activos, en orden de creación
+        self._active_by_provider: Dict[str, Dict[str, InfrastructureRecord]] = {}
 
     def add(self, record: InfrastructureRecord):
-        self._store[record.id] = record
+        self._active[record.id] = record
+        self._active_by_provider.setdefault(record.provider.lower(), {})[record.id] = record
 
-    def list(self) -> List[InfrastructureRecord]:
-        return [r for r in self._store.values() if r.status == "active"]
+    def list(self, provider: Optional[str] = None, offset: int = 0, limit: Optional[int] = None) -> Tuple[List[InfrastructureRecord], int]:
+        """Página de registros activos (opcionalmente de un proveedor) y total sin paginar"""
+        source = self._active if provider is None else self._active_by_provider.get(provider.lower(), {})
+        stop = None if limit is None else offset + limit
+        return list(islice(source.values(), offset, stop)), len(source)
 
     def get(self, infra_id: str) -> Optional[InfrastructureRecord]:
-        return self._store.get(infra_id)
+        """Registro activo; los eliminados no se exponen"""
+        return self._active.get(infra_id)
 
     def update(self, infra_id: str, updater) -> InfrastructureRecord:
-        rec = self._store.get(infra_id)
-        if not rec or rec.status != "active":
+        rec = self._active.get(infra_id)
+        if rec is None:
             raise KeyError("Infraestructura no encontrada")
+        # Mutación in situ: no hace falta reasignar la entrada
         updater(rec)
-        rec.updated_at = datetime.utcnow()
-        self._store[infra_id] = rec
+        rec.updated_at = datetime.now(timezone.utc)
         return rec
 
     def delete(self, infra_id: str) -> InfrastructureRecord:
-        rec = self._store.get(infra_id)
-        if not rec or rec.status != "active":
+        rec = self._active.pop(infra_id, None)
+        if rec is None:
             raise KeyError("Infraestructura no encontrada")
+        self._active_by_provider[rec.provider.lower()].pop(infra_id, None)
         rec.status = "deleted"
-        rec.updated_at = datetime.utcnow()
+        rec.updated_at = datetime.now(timezone.utc)
+        self._deleted[infra_id] = rec
         return rec
 
 
 _infra_repo = _InfrastructureRepository()
 
 
-@router.post("/infrastructure/create", response_model=InfrastructureResponse)
-def create_infrastructure(request: InfrastructureCreateRequest):
+# ===================== DEFAULTS POR PROVEEDOR =====================
+# Tablas inmutables construidas una sola vez al importar el módulo; cada
+# petición solo fusiona (dict unpacking) los defaults con la config recibida.
+
+def _frozen(table: Dict[str, Dict[str, Any]]) -> MappingProxyType:
+    return MappingProxyType({key: MappingProxyType(value) for key, value in table.items()})
+
+
+_EMPTY_DEFAULTS: MappingProxyType = MappingProxyType({})
+_DEFAULT_RESOURCE_GROUP = "rg-default"
+_DEFAULT_COMPARTMENT_ID = "ocid1.compartment.oc1..exampleuniqueID"
+
+# Campos mínimos que cada factory requiere para crear la VM
+_VM_DEFAULTS = _frozen({
+    "aws": {
+        "instance_type": "t2.micro",
+        "ami": "ami-0abcdef1234567890",
+        "vpc_id": "vpc-12345678"
+    },
+    "azure": {
+        "vm_size": "Standard_B1s",
+        "resource_group": _DEFAULT_RESOURCE_GROUP,
+        "image": "Ubuntu 20.04 LTS"
+    },
+    "gcp": {
+        "machine_type": "e2-micro",
+        "zone": "us-central1-a",
+        "project": "demo-project"
+    },
+    "oracle": {
+        "compute_shape": "VM.Standard2.1",
+        "compartment_id": _DEFAULT_COMPARTMENT_ID,
+        "availability_domain": "AD-1",
+        "subnet_id": "ocid1.subnet.oc1..examplesubnet",
+        "image_id": "ocid1.image.oc1..exampleimage"
+    },
+    "onprem": {
+        "cpu": 2,
+        "ram_gb": 4,
+        "disk_gb": 50
+    }
+})
+
+# Campos que DB, LB y storage heredan de la config de la VM (con su valor por defecto)
+_LINKED_VM_FIELDS = _frozen({
+    "azure": {"resource_group": _DEFAULT_RESOURCE_GROUP},
+    "oracle": {"compartment_id": _DEFAULT_COMPARTMENT_ID}
+})
+
+# Defaults de base de datos que se fusionan con la config del usuario
+_DB_DEFAULTS = _frozen({
+    "azure": {"tier": "Basic"},
+    "oracle": {"workload_type": "OLTP", "cpu_count": 1, "storage_size": 20}
+})
+
+# Sufijo del servidor de BD derivado del nombre de la infraestructura
+_DB_SERVER_SUFFIX = MappingProxyType({"azure": "-sqlsrv"})
+
+# Config genérica usada solo cuando no se envía database_config (AWS, GCP, OnPrem)
+_GENERIC_DB_CONFIG = MappingProxyType({
+    "engine": "mysql",
+    "instance_class": "db.t3.micro",
+    "allocated_storage": 20
+})
+
+_GENERIC_LB_CONFIG = MappingProxyType({
+    "load_balancer_type": "application",
+    "scheme": "internet-facing"
+})
+
+_LB_DEFAULTS = _frozen({
+    "aws": {"vpc_id": "vpc-12345678"},
+    "oracle": {"shape": "100Mbps"}
+})
+
+# Config de storage usada solo cuando no se envía storage_config
+_STORAGE_DEFAULTS = _frozen({
+    "aws": {"size_gb": 100, "storage_type": "gp3"},
+    "onprem": {"storage_type": "nfs", "capacity_gb": 1000},
+    "oracle": {"namespace": "mytenantns", "storage_tier": "Standard"}
+})
+
+_GENERIC_STORAGE_CONFIG = MappingProxyType({
+    "size_gb": 100,
+    "storage_type": "standard"
+})
+
+
+def _linked_fields(provider: str, vm_config: Dict[str, Any]) -> Dict[str, Any]:
+    linked = _LINKED_VM_FIELDS.get(provider)
+    if linked is None:
+        return _EMPTY_DEFAULTS
+    return {field: vm_config.get(field, default) for field, default in linked.items()}
+
+
+def _vm_config_for(request: InfrastructureCreateRequest) -> Dict[str, Any]:
+    """Defaults del proveedor < región de la petición < vm_config del usuario"""
+    return {
+        **_VM_DEFAULTS.get(request.provider, _EMPTY_DEFAULTS),
+        "region": request.region,
+        **(request.vm_config or _EMPTY_DEFAULTS)
+    }
+
+
+def _db_config_for(request: InfrastructureCreateRequest, vm_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Proveedores con defaults de BD completan la config del usuario; el resto usa la genérica si no se envía"""
+    defaults = _DB_DEFAULTS.get(request.provider)
+    if defaults is None:
+        return request.database_config or {"region": request.region, **_GENERIC_DB_CONFIG}
+    suffix = _DB_SERVER_SUFFIX.get(request.provider)
+    return {
+        **defaults,
+        **({"server_name": request.name + suffix} if suffix else _EMPTY_DEFAULTS),
+        **_linked_fields(request.provider, vm_config),
+        "region": request.region,
+        **(request.database_config or _EMPTY_DEFAULTS)
+    }
+
+
+def _lb_config_for(request: InfrastructureCreateRequest, vm_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Config del usuario (o genérica) completada con los campos requeridos por proveedor"""
+    provider_defaults = _LB_DEFAULTS.get(request.provider, _EMPTY_DEFAULTS)
+    linked = _linked_fields(request.provider, vm_config)
+    if request.load_balancer_config:
+        return {**provider_defaults, **linked, **request.load_balancer_config}
+    return {**provider_defaults, **linked, "region": request.region, **_GENERIC_LB_CONFIG}
+
+
+def _storage_config_for(request: InfrastructureCreateRequest, vm_config: Dict[str, Any]) -> Dict[str, Any]:
+    """La storage_config del usuario se usa tal cual; si no se envía, defaults por proveedor"""
+    if request.storage_config:
+        return request.storage_config
+    defaults = _STORAGE_DEFAULTS.get(request.provider)
+    if defaults is None:
+        return {"region": request.region, **_GENERIC_STORAGE_CONFIG}
+    return {"region": request.region, **defaults, **_linked_fields(request.provider, vm_config)}
+
+
+# Recursos opcionales: (clave, método de la factory, sufijo del nombre, flag include_*, builder de config)
+_OPTIONAL_RESOURCES = (
+    ("database", "create_database", "db", "include_database", _db_config_for),
+    ("load_balancer", "create_load_balancer", "lb", "include_load_balancer", _lb_config_for),
+    ("storage", "create_storage", "storage", "include_storage", _storage_config_for),
+)
+
+
+# Códigos válidos -> enum; el conjunto de proveedores es fijo (CloudProvider)
+_PROVIDERS_BY_CODE = MappingProxyType({p.value: p for p in CloudProvider})
+# Listado para los mensajes de error (se formatea igual que antes: ['aws', ...])
+_PROVIDER_CODES = list(_PROVIDERS_BY_CODE)
+
+
+def _parse_provider(provider: str) -> Optional[CloudProvider]:
+    """Convierte el código recibido al enum; None si no está soportado (sin excepciones)"""
+    # Caso habitual (código ya en minúsculas) sin crear la cadena de lower()
+    return _PROVIDERS_BY_CODE.get(provider) or _PROVIDERS_BY_CODE.get(provider.lower())
+
+
+_RESOURCE_ATTRS = attrgetter("name", "resource_id", "region", "status", "get_resource_type", "get_specs")
+
+
+def _describe_resource(resource: CloudResource) -> Dict[str, Any]:
+    """Resumen serializable de un recurso creado por la factory"""
+    name, resource_id, region, status, get_type, get_specs = _RESOURCE_ATTRS(resource)
+    return {
+        "name": name,
+        "resource_id": resource_id,
+        "region": region,
+        "status": status.value,
+        "type": get_type(),
+        "specs": get_specs()
+    }
+
+
+# Esquema del body publicado en OpenAPI (el endpoint valida el body manualmente)
+_CREATE_REQUEST_BODY = {
+    "required": True,
+    "content": {"application/json": {"schema": InfrastructureCreateRequest.model_json_schema()}}
+}
+
+
+def _parse_create_request(body: bytes) -> InfrastructureCreateRequest:
+    """
+    Valida los bytes del body directamente en el core de Pydantic (model_validate_json),
+    sin el json.loads + validación por campo que FastAPI hace para un parámetro modelo.
+    Los errores se devuelven como 422 con el mismo formato que FastAPI.
+    """
+    if not body:
+        raise RequestValidationError([{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}])
+    try:
+        return InfrastructureCreateRequest.model_validate_json(body)
+    except ValidationError as exc:
+        raise RequestValidationError([
+            {**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)
+        ])
+
+
+@router.post(
+    "/infrastructure/create",
+    responses={200: {"model": InfrastructureResponse}},
+    openapi_extra={"requestBody": _CREATE_REQUEST_BODY}
+)
+async def create_infrastructure(raw_request: Request):
     """
     Crea una infraestructura completa usando el patrón Abstract Factory.
     
     Este endpoint demuestra cómo el Abstract Factory permite crear
     familias de productos relacionados de diferentes proveedores de cloud.
+    Las llamadas a las factories (síncronas) se ejecutan en el threadpool
+    para no bloquear el event loop.
     """
+    request = _parse_create_request(await raw_request.body())
+    logger.debug("Iniciando creación de infraestructura para proveedor: %s", request.provider)
+
+    # Obtener la factory para el proveedor
+    provider_enum = _parse_provider(request.provider)
+    if provider_enum is None:
+        raise HTTPException(
+            status_code=400, 
+            detail=f"Proveedor '{request.provider}' no soportado. Proveedores disponibles: {_PROVIDER_CODES}"
+        )
     try:
-        print(f"📦 Iniciando creación de infraestructura para proveedor: {request.provider}")
-        
-        # Obtener la factory para el proveedor
-        try:
-            provider_enum = CloudProvider(request.provider.lower())
-            factory = create_cloud_factory(provider_enum)
-        except ValueError:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Proveedor '{request.provider}' no soportado. Proveedores disponibles: {[p.value for p in CloudProvider]}"
-            )
-        print(f"🏭 Factory obtenida: {type(factory).__name__}")
-        
-        # Lista para almacenar recursos creados
-        resources_created = []
-        infrastructure_details = {}
-        
-        # Crear VM siempre (recurso base)
-        vm_name = f"{request.name}-vm"
-        
-        # Preparar configuración de VM
-        if request.vm_config:
-            vm_config = request.vm_config.copy()
-        else:
-            vm_config = {}
-        
-        # Asegurar configuración mínima por proveedor
-        vm_config["region"] = vm_config.get("region", request.region)
+        factory = create_cloud_factory(provider_enum)
+        logger.debug("Factory obtenida: %s", type(factory).__name__)
         
-        if request.provider == "aws":
-            # Campos requeridos por AWS factory - siempre necesarios
-            if "instance_type" not in vm_config:
-                vm_config["instance_type"] = "t2.micro"
-            if "ami" not in vm_config:
-                vm_config["ami"] = "ami-0abcdef1234567890"  
-            if "vpc_id" not in vm_config:
-                vm_config["vpc_id"] = "vpc-12345678"
-            # Los campos opcionales como key_pair se preservan si los envió el usuario
-        elif request.provider == "azure":
-            vm_config.setdefault("vm_size", "Standard_B1s")
-            vm_config.setdefault("resource_group", "rg-default")
-            vm_config.setdefault("image", "Ubuntu 20.04 LTS")
-        elif request.provider == "gcp":
-            vm_config.setdefault("machine_type", "e2-micro")
-            vm_config.setdefault("zone", "us-central1-a")
-            vm_config.setdefault("project", "demo-project")
-        elif request.provider == "oracle":
-            vm_config.setdefault("compute_shape", "VM.Standard2.1")
-            vm_config.setdefault("compartment_id", "ocid1.compartment.oc1..exampleuniqueID")
-            vm_config.setdefault("availability_domain", "AD-1")
-            vm_config.setdefault("subnet_id", "ocid1.subnet.oc1..examplesubnet")
-            vm_config.setdefault("image_id", "ocid1.image.oc1..exampleimage")
-        elif request.provider == "onprem":
-            vm_config.setdefault("cpu", 2)
-            vm_config.setdefault("ram_gb", 4)
-            vm_config.setdefault("disk_gb", 50)
+        # Configuración de VM: defaults del proveedor + región + config del usuario
+        vm_config = _vm_config_for(request)
         
-        vm = factory.create_virtual_machine(vm_name, vm_config)
-        vm_info = {
-            "name": vm.name,
-            "resource_id": vm.resource_id,
-            "region": vm.region,
-            "status": vm.status.value,
-            "type": vm.get_resource_type(),
-            "specs": vm.get_specs()
-        }
-        resources_created.append("virtual_machine")
-        infrastructure_details["virtual_machine"] = vm_info
-        print(f"🖥️ VM creada: {vm_info}")
+        # Recursos a crear: (clave, método de la factory, nombre, config). La VM siempre
+        # se crea (recurso base); el resto según los flags include_*
+        jobs = [("virtual_machine", factory.create_virtual_machine, f"{request.name}-vm", vm_config)]
+        for key, method, suffix, include_flag, build_config in _OPTIONAL_RESOURCES:
+            if getattr(request, include_flag):
+                jobs.append((key, getattr(factory, method), f"{request.name}-{suffix}", build_config(request, vm_config)))
         
-        # Crear Database si se requiere
-        if request.include_database:
-            db_name = f"{request.name}-db"
-            if request.provider == "azure":
-                # Defaults específicos de Azure (campos requeridos: tier, server_name, resource_group, region)
-                if request.database_config:
-                    db_config = request.database_config.copy()
-                else:
-                    db_config = {
-                        "region": request.region,
-                        "tier": "Basic",
-                        "server_name": f"{request.name}-sqlsrv",
-                        "resource_group": vm_config.get("resource_group", "rg-default")
-                    }
-                # Asegurar campos faltantes mínimos
-                db_config.setdefault("tier", "Basic")
-                db_config.setdefault("server_name", f"{request.name}-sqlsrv")
-                db_config.setdefault("resource_group", vm_config.get("resource_group", "rg-default"))
-                db_config.setdefault("region", request.region)
-            elif request.provider == "oracle":
-                # Defaults específicos de Oracle
-                db_config = request.database_config or {}
-                db_config.setdefault("workload_type", "OLTP")
-                db_config.setdefault("compartment_id", vm_config.get("compartment_id", "ocid1.compartment.oc1..exampleuniqueID"))
-                db_config.setdefault("cpu_count", 1)
-                db_config.setdefault("storage_size", 20)
-                db_config.setdefault("region", request.region)
-            else:
-                # Defaults genéricos (ej. AWS, GCP, OnPrem, etc.)
-                db_config = request.database_config or {
-                    "region": request.region,
-                    "engine": "mysql",
-                    "instance_class": "db.t3.micro",
-                    "allocated_storage": 20
-                }
-            
-            db = factory.create_database(db_name, db_config)
-            db_info = {
-                "name": db.name,
-                "resource_id": db.resource_id,
-                "region": db.region,
-                "status": db.status.value,
-                "type": db.get_resource_type(),
-                "specs": db.get_specs()
-            }
-            resources_created.append("database")
-            infrastructure_details["database"] = db_info
-            print(f"🗄️ Database creada: {db_info}")
+        # Las creaciones son independientes entre sí: se lanzan en paralelo en el threadpool
+        results = await asyncio.gather(
+            *(run_in_threadpool(create, name, config) for _, create, name, config in jobs),
+            return_exceptions=True
+        )
+        # Propagar el primer error en el orden original (VM, DB, LB, Storage)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
         
-        # Crear Load Balancer si se requiere
-        if request.include_load_balancer:
-            lb_name = f"{request.name}-lb"
-            lb_config = request.load_balancer_config or {
-                "region": request.region,
-                "load_balancer_type": "application",
-                "scheme": "internet-facing"
-            }
-            
-            # Asegurar campos requeridos por proveedor para Load Balancer
-            if request.provider == "aws":
-                if "vpc_id" not in lb_config:
-                    lb_config["vpc_id"] = "vpc-12345678"  # Usar el mismo VPC que la VM
-            elif request.provider == "azure":
-                # Azure requiere resource_group y region
-                lb_config.setdefault("resource_group", vm_config.get("resource_group", "rg-default"))
-            elif request.provider == "oracle":
-                # Oracle requiere compartment_id
-                lb_config.setdefault("compartment_id", vm_config.get("compartment_id", "ocid1.compartment.oc1..exampleuniqueID"))
-                lb_config.setdefault("shape", "100Mbps")
-            
-            lb = factory.create_load_balancer(lb_name, lb_config)
-            lb_info = {
-                "name": lb.name,
-                "resource_id": lb.resource_id,
-                "region": lb.region,
-                "status": lb.status.value,
-                "type": lb.get_resource_type(),
-                "specs": lb.get_specs()
-            }
-            resources_created.append("load_balancer")
-            infrastructure_details["load_balancer"] = lb_info
-            print(f"⚖️ Load Balancer creado: {lb_info}")
+        infrastructure_details = {}
+        for (key, _, _, _), resource in zip(jobs, results):
+            infrastructure_details[key] = _describe_resource(resource)
+            logger.debug("Recurso %s creado: %s", key, infrastructure_details[key])
         
-        # Crear Storage si se requiere
-        if request.include_storage:
-            storage_name = f"{request.name}-storage"
-            
-            # Defaults específicos por proveedor para storage
-            if request.storage_config:
-                storage_config = request.storage_config
-            else:
-                if request.provider == "aws":
-                    storage_config = {
-                        "region": request.region,
-                        "size_gb": 100,
-                        "storage_type": "gp3"
-                    }
-                elif request.provider == "onprem":
-                    storage_config = {
-                        "region": request.region,
-                        "storage_type": "nfs",
-                        "capacity_gb": 1000
-                    }
-                elif request.provider == "oracle":
-                    storage_config = {
-                        "region": request.region,
-                        "namespace": "mytenantns",
-                        "compartment_id": vm_config.get("compartment_id", "ocid1.compartment.oc1..exampleuniqueID"),
-                        "storage_tier": "Standard"
-                    }
-                else:
-                    storage_config = {
-                        "region": request.region,
-                        "size_gb": 100,
-                        "storage_type": "standard"
-                    }
-            
-            storage = factory.create_storage(storage_name, storage_config) 
-            storage_info = {
-                "name": storage.name,
-                "resource_id": storage.resource_id,
-                "region": storage.region,
-                "status": storage.status.value,
-                "type": storage.get_resource_type(),
-                "specs": storage.get_specs()
-            }
-            resources_created.append("storage")
-            infrastructure_details["storage"] = storage_info
-            print(f"💾 Storage creado: {storage_info}")
+        resources_count = len(infrastructure_details)
         
-        # Registrar en logs
-        audit_log(
+        # Registrar en logs (encolado; se escribe por lotes fuera de la petición)
+        audit_queue.submit(
             actor=request.requested_by,
             action="create_infrastructure",
             vm_id=f"{request.name}-infrastructure",
@@ -379,49 +457,50 @@ def create_infrastructure(request: InfrastructureCreateRequest):
             success=True,
             details={
                 "infrastructure_name": request.name,
-                "resources_created": len(resources_created),
+                "resources_created": resources_count,
                 "pattern": "Abstract Factory"
             }
         )
         
-        infra_id = str(uuid4())
-        record = InfrastructureRecord(
+        infra_id = _INFRA_ID_PREFIX + uuid4().hex
+        now = datetime.now(timezone.utc)
+        # Datos construidos por el propio handler: model_construct evita
+        # re-validar todo el árbol de resources
+        record = InfrastructureRecord.model_construct(
             id=infra_id,
             name=request.name,
             provider=request.provider,
             region=request.region,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=now,
+            updated_at=now,
             requested_by=request.requested_by,
             resources=infrastructure_details,
             includes={
-                "database": request.include_database,
-                "load_balancer": request.include_load_balancer,
-                "storage": request.include_storage
+                "database": bool(request.include_database),
+                "load_balancer": bool(request.include_load_balancer),
+                "storage": bool(request.include_storage)
             }
         )
         _infra_repo.add(record)
 
-        result = InfrastructureResponse(
-            success=True,
-            message=f"Infraestructura '{request.name}' creada exitosamente usando {request.provider.upper()}",
-            provider=request.provider,
-            infrastructure_id=infra_id,
-            resources_created=len(resources_created),
-            infrastructure=infrastructure_details
-        )
-        
-        print(f"✅ Infraestructura creada exitosamente: {len(resources_created)} recursos")
-        return result
+        result = {
+            "success": True,
+            "message": f"Infraestructura '{request.name}' creada exitosamente usando {request.provider.upper()}",
+            "provider": request.provider,
+            "infrastructure_id": infra_id,
+            "resources_created": resources_count,
+            "infrastructure": infrastructure_details,
+            "error": None
+        }
         
-    except HTTPException as he:
-        # Dejar pasar los errores ya formateados
-        raise he
-    except KeyError as e:
-        error_msg = f"Proveedor '{request.provider}' no soportado. Proveedores disponibles: aws, azure, gcp, oracle, onprem"
-        print(f"❌ Error de proveedor: {error_msg}")
+        logger.debug("Infraestructura creada exitosamente: %d recursos", resources_count)
+        return json_response(result, InfrastructureResponse)
+
+    except KeyError:
+        error_msg = f"Proveedor '{request.provider}' no soportado. Proveedores disponibles: {_PROVIDER_CODES}"
+        logger.error("Error de proveedor: %s", error_msg)
         
-        audit_log(
+        audit_queue.submit(
             actor=request.requested_by,
             action="create_infrastructure",
             vm_id="error",
@@ -433,10 +512,11 @@ def create_infrastructure(request: InfrastructureCreateRequest):
         raise HTTPException(status_code=400, detail=error_msg)
         
     except Exception as e:
+        # Cualquier fallo de creación queda auditado antes de responder 500
         error_msg = f"Error interno al crear infraestructura: {str(e)}"
-        print(f"❌ Error interno: {error_msg}")
+        logger.error("Error interno: %s", error_msg)
         
-        audit_log(
+        audit_queue.submit(
             actor=request.requested_by,
             action="create_infrastructure",
             vm_id="error",
@@ -448,224 +528,254 @@ def create_infrastructure(request: InfrastructureCreateRequest):
         raise HTTPException(status_code=500, detail=error_msg)
 
 
-@router.get("/providers", response_model=Dict[str, Any])
-def get_supported_providers():
+# Textos estáticos de los endpoints de proveedores
+_PROVIDERS_DESCRIPTION = "List of cloud providers supported by the Abstract Factory"
+_SUPPORTED_SERVICES = ("Virtual Machines", "Databases", "Load Balancers", "Storage")
+
+
+@lru_cache(maxsize=8)
+def _providers_json(providers: tuple) -> StaticJSON:
+    """
+    Serializa el listado de proveedores. La clave es el propio registro, de modo
+    que registrar una factory personalizada invalida la entrada cacheada.
+    """
+    return static_json({
+        "supported_providers": list(providers),
+        "total": len(providers),
+        "description": _PROVIDERS_DESCRIPTION
+    })
+
+
+@router.get("/providers", responses={200: {"model": Dict[str, Any]}})
+async def get_supported_providers(request: Request):
     """
     Obtiene la lista de proveedores de cloud soportados.
     """
-    try:
-        providers = get_available_providers()
-        
-        return {
-            "supported_providers": providers,
-            "total": len(providers),
-            "description": "List of cloud providers supported by the Abstract Factory"
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Error fetching providers")
+    return static_json_response(_providers_json(get_available_provider_codes()), request)
+
+
+# Capacidad declarada en CloudAbstractFactory.CAPABILITIES -> (clave de respuesta, método)
+_CAPABILITY_TABLE = (
+    ("regions", "supported_regions", "get_supported_regions"),
+    ("instance_types", "recommended_instance_types", "get_recommended_instance_types"),
+    ("vm_sizes", "recommended_vm_sizes", "get_recommended_vm_sizes"),
+    ("machine_types", "machine_types", "get_supported_machine_types"),
+    ("database_engines", "database_engines", "get_supported_database_engines"),
+    ("load_balancer_types", "load_balancer_types", "get_supported_load_balancer_types"),
+    ("storage_classes", "storage_classes", "get_supported_storage_classes"),
+    ("locations", "locations", "get_supported_locations"),
+    ("compute_shapes", "compute_shapes", "get_supported_compute_shapes"),
+    ("database_workloads", "database_workloads", "get_supported_database_workloads"),
+    ("load_balancer_shapes", "load_balancer_shapes", "get_supported_load_balancer_shapes"),
+    ("storage_tiers", "storage_tiers", "get_supported_storage_tiers"),
+)
 
 
-@router.get("/providers/{provider}/info", response_model=Dict[str, Any])
-def get_provider_info(provider: str):
+@lru_cache(maxsize=64)
+def _provider_info_json(factory: CloudAbstractFactory, provider_code: str) -> StaticJSON:
     """
-    Obtiene información específica de un proveedor.
+    Construye y serializa la información de un proveedor. La clave es la propia
+    instancia registrada, de modo que registrar una factory personalizada
+    invalida la entrada cacheada.
     """
-    try:
-        # Convertir string a enum
-        try:
-            provider_enum = CloudProvider(provider.lower())
-        except ValueError:
-            raise HTTPException(status_code=404, detail=f"Proveedor '{provider}' no soportado")
+    info = {
+        "provider_name": factory.get_provider_name(),
+        "provider_code": provider_code,
+        "supported_services": _SUPPORTED_SERVICES
+    }
+    
+    # Información específica según las capacidades declaradas por la factory
+    for capability, key, method in _CAPABILITY_TABLE:
+        if capability in factory.CAPABILITIES:
+            value = getattr(factory, method)()
+            if isinstance(value, (set, frozenset)):
+                # Orden estable entre procesos (hash aleatorio por proceso):
+                # mismo cuerpo y mismo ETag en todos los workers
+                value = sorted(value)
+            elif isinstance(value, MappingProxyType):
+                value = dict(value)
+            info[key] = value
+    
+    return static_json(info)
 
-        factory = create_cloud_factory(provider_enum)
-        
-        info = {
-            "provider_name": factory.get_provider_name(),
-            "provider_code": provider,
-            "supported_services": [
-                "Virtual Machines",
-                "Databases", 
-                "Load Balancers",
-                "Storage"
-            ]
+
+@router.get("/providers/{provider}/info", responses={200: {"model": Dict[str, Any]}})
+async def get_provider_info(provider: str, request: Request):
+    """
+    Obtiene información específica de un proveedor.
+    """
+    # Convertir string a enum
+    provider_enum = _parse_provider(provider)
+    if provider_enum is None:
+        raise HTTPException(status_code=404, detail=f"Proveedor '{provider}' no soportado")
+
+    factory = create_cloud_factory(provider_enum)
+    return static_json_response(_provider_info_json(factory, provider), request)
+
+
+# Payload estático: se serializa una única vez al importar el módulo
+_INFRASTRUCTURE_EXAMPLES = {
+    "aws": {
+        "provider": "aws",
+        "vm": {
+            "name": "web-server",
+            "config": {
+                "instance_type": "t3.micro",
+                "ami": "ami-0abcdef1234567890",
+                "vpc_id": "vpc-12345",
+                "region": "us-east-1",
+                "security_groups": ["sg-web-servers"]
+            }
+        },
+        "database": {
+            "name": "app-db",
+            "config": {
+                "engine": "mysql",
+                "instance_class": "db.t3.micro",
+                "allocated_storage": 20,
+                "region": "us-east-1"
+            }
+        },
+        "storage": {
+            "name": "app-files",
+            "config": {
+                "region": "us-east-1",
+                "storage_class": "STANDARD",
+                "versioning_enabled": True
+            }
         }
-        
-        # Información específica por proveedor
-        if hasattr(factory, 'get_supported_regions'):
-            info["supported_regions"] = list(factory.get_supported_regions())
-        
-        if hasattr(factory, 'get_recommended_instance_types'):
-            info["recommended_instance_types"] = factory.get_recommended_instance_types()
-        elif hasattr(factory, 'get_recommended_vm_sizes'):
-            info["recommended_vm_sizes"] = factory.get_recommended_vm_sizes()
-
-        # Información específica adicional por proveedor
-        # AWS ya expone recommended_instance_types
-        if provider_enum == CloudProvider.GCP:
-            if hasattr(factory, 'get_supported_machine_types'):
-                info["machine_types"] = factory.get_supported_machine_types()
-            if hasattr(factory, 'get_supported_database_engines'):
-                info["database_engines"] = factory.get_supported_database_engines()
-            if hasattr(factory, 'get_supported_load_balancer_types'):
-                info["load_balancer_types"] = factory.get_supported_load_balancer_types()
-            if hasattr(factory, 'get_supported_storage_classes'):
-                info["storage_classes"] = factory.get_supported_storage_classes()
-            if hasattr(factory, 'get_supported_locations'):
-                info["locations"] = factory.get_supported_locations()
-        elif provider_enum == CloudProvider.ORACLE:
-            if hasattr(factory, 'get_supported_compute_shapes'):
-                info["compute_shapes"] = factory.get_supported_compute_shapes()
-            if hasattr(factory, 'get_supported_database_workloads'):
-                info["database_workloads"] = factory.get_supported_database_workloads()
-            if hasattr(factory, 'get_supported_load_balancer_shapes'):
-                info["load_balancer_shapes"] = factory.get_supported_load_balancer_shapes()
-            if hasattr(factory, 'get_supported_storage_tiers'):
-                info["storage_tiers"] = factory.get_supported_storage_tiers()
-        
-        return info
-        
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Error fetching provider info")
+    },
+    "azure": {
+        "provider": "azure",
+        "vm": {
+            "name": "web-server",
+            "config": {
+                "vm_size": "Standard_B1s",
+                "image": "UbuntuLTS",
+                "resource_group": "my-rg",
+                "region": "eastus"
+            }
+        },
+        "database": {
+            "name": "app-db",
+            "config": {
+                "tier": "Basic",
+                "server_name": "mydbserver",
+                "resource_group": "my-rg",
+                "region": "eastus"
+            }
+        },
+        "storage": {
+            "name": "appfiles",
+            "config": {
+                "region": "eastus",
+                "account_type": "Standard_LRS",
+                "access_tier": "Hot"
+            }
+        }
+    }
+}
+
+_EXAMPLES_JSON = static_json({
+    "description": "Example configurations for different cloud providers",
+    "examples": _INFRASTRUCTURE_EXAMPLES
+})
+
+
+# Debe registrarse antes de /infrastructure/{infrastructure_id}: Starlette
+# resuelve las rutas por orden y "examples" se tomaría como un ID
+@router.get("/infrastructure/examples", responses={200: {"model": Dict[str, Any]}})
+async def get_infrastructure_examples(request: Request):
+    """
+    Obtiene ejemplos de configuración de infraestructura para diferentes proveedores.
+    """
+    return static_json_response(_EXAMPLES_JSON, request)
 
 
 # ===================== NUEVOS ENDPOINTS CRUD INFRAESTRUCTURA =====================
 
+async def _stream_list(items: List[InfrastructureRecord], total: int, page: int, page_size: int):
+    """
+    Emite el listado como un array JSON registro a registro (orjson por elemento):
+    no se construye el documento completo en memoria antes de enviarlo.
+    """
+    yield b'{"total":%d,"items":[' % total
+    for index, rec in enumerate(items):
+        if index:
+            yield b","
+        yield orjson.dumps(rec.model_dump())
+    yield b'],"page":%d,"page_size":%d}' % (page, page_size)
+
+
 @router.get("/infrastructure", response_model=InfrastructureListResponse)
-def list_infrastructures():
-    items = _infra_repo.list()
-    return InfrastructureListResponse(total=len(items), items=items)
+async def list_infrastructures(
+    provider: Optional[str] = Query(None, description="Filtrar por proveedor (aws, azure, gcp, oracle, onprem)"),
+    page: int = Query(1, ge=1, description="Número de página"),
+    page_size: int = Query(50, ge=1, le=200, description="Tamaño de página (máx 200)")
+):
+    items, total = _infra_repo.list(provider, offset=(page - 1) * page_size, limit=page_size)
+    if VALIDATE_API_RESPONSE:
+        return json_response({
+            "total": total,
+            "items": [rec.model_dump() for rec in items],
+            "page": page,
+            "page_size": page_size
+        }, InfrastructureListResponse)
+    return StreamingResponse(_stream_list(items, total, page, page_size), media_type="application/json")
 
 
 @router.get("/infrastructure/{infrastructure_id}", response_model=InfrastructureRecord)
-def get_infrastructure(infrastructure_id: str):
+async def get_infrastructure(infrastructure_id: str):
     rec = _infra_repo.get(infrastructure_id)
-    if not rec or rec.status != "active":
+    if rec is None:
         raise HTTPException(status_code=404, detail="Infraestructura no encontrada")
-    return rec
+    return json_response(rec.model_dump(), InfrastructureRecord)
+
+
+# Componentes opcionales actualizables: (clave en resources/includes, campo de config, flag include_*)
+_UPDATABLE_COMPONENTS = (
+    ("database", "database_config", "include_database"),
+    ("load_balancer", "load_balancer_config", "include_load_balancer"),
+    ("storage", "storage_config", "include_storage"),
+)
+
+
+def _apply_infrastructure_update(rec: InfrastructureRecord, update: InfrastructureUpdateRequest) -> None:
+    """Fusiona las configs nuevas en los specs existentes (o añade el componente) y aplica los flags"""
+    resources, includes = rec.resources, rec.includes
+    # La VM solo se actualiza si existe; no se añade
+    if update.vm_config and "virtual_machine" in resources:
+        resources["virtual_machine"]["specs"].update(update.vm_config)
+    for key, config_field, include_field in _UPDATABLE_COMPONENTS:
+        config = getattr(update, config_field)
+        if config:
+            if key in resources:
+                resources[key]["specs"].update(config)
+            else:
+                includes[key] = True
+                resources[key] = {"added": True, "specs": config}
+        include = getattr(update, include_field)
+        if include is not None:
+            includes[key] = include
 
 
 @router.put("/infrastructure/{infrastructure_id}", response_model=InfrastructureRecord)
-def update_infrastructure(infrastructure_id: str, update: InfrastructureUpdateRequest):
+async def update_infrastructure(infrastructure_id: str, update: InfrastructureUpdateRequest):
     try:
-        def _apply(rec: InfrastructureRecord):
-            # Actualizar recursos existentes según configs nuevas
-            if update.vm_config and "virtual_machine" in rec.resources:
-                # Merge specs
-                rec.resources["virtual_machine"]["specs"].update(update.vm_config)
-            if update.database_config:
-                if "database" in rec.resources:
-                    rec.resources["database"]["specs"].update(update.database_config)
-                else:
-                    rec.includes["database"] = True
-                    rec.resources["database"] = {"added": True, "specs": update.database_config}
-            if update.load_balancer_config:
-                if "load_balancer" in rec.resources:
-                    rec.resources["load_balancer"]["specs"].update(update.load_balancer_config)
-                else:
-                    rec.includes["load_balancer"] = True
-                    rec.resources["load_balancer"] = {"added": True, "specs": update.load_balancer_config}
-            if update.storage_config:
-                if "storage" in rec.resources:
-                    rec.resources["storage"]["specs"].update(update.storage_config)
-                else:
-                    rec.includes["storage"] = True
-                    rec.resources["storage"] = {"added": True, "specs": update.storage_config}
-            # Flags de inclusión
-            if update.include_database is not None:
-                rec.includes["database"] = update.include_database
-            if update.include_load_balancer is not None:
-                rec.includes["load_balancer"] = update.include_load_balancer
-            if update.include_storage is not None:
-                rec.includes["storage"] = update.include_storage
-        updated = _infra_repo.update(infrastructure_id, _apply)
-        return updated
+        updated = _infra_repo.update(infrastructure_id, lambda rec: _apply_infrastructure_update(rec, update))
+        return json_response(updated.model_dump(), InfrastructureRecord)
     except KeyError:
         raise HTTPException(status_code=404, detail="Infraestructura no encontrada")
 
 
 @router.delete("/infrastructure/{infrastructure_id}", response_model=InfrastructureDeleteResponse)
-def delete_infrastructure(infrastructure_id: str):
+async def delete_infrastructure(infrastructure_id: str):
     try:
         rec = _infra_repo.delete(infrastructure_id)
-        return InfrastructureDeleteResponse(
-            success=True,
-            message=f"Infraestructura '{rec.name}' eliminada (soft-delete)",
-            infrastructure_id=infrastructure_id
-        )
+        return json_response({
+            "success": True,
+            "message": f"Infraestructura '{rec.name}' eliminada (soft-delete)",
+            "infrastructure_id": infrastructure_id
+        }, InfrastructureDeleteResponse)
     except KeyError:
         raise HTTPException(status_code=404, detail="Infraestructura no encontrada")
-
-
-@router.get("/infrastructure/examples", response_model=Dict[str, Any])
-def get_infrastructure_examples():
-    """
-    Obtiene ejemplos de configuración de infraestructura para diferentes proveedores.
-    """
-    examples = {
-        "aws": {
-            "provider": "aws",
-            "vm": {
-                "name": "web-server",
-                "config": {
-                    "instance_type": "t3.micro",
-                    "ami": "ami-0abcdef1234567890",
-                    "vpc_id": "vpc-12345",
-                    "region": "us-east-1",
-                    "security_groups": ["sg-web-servers"]
-                }
-            },
-            "database": {
-                "name": "app-db",
-                "config": {
-                    "engine": "mysql",
-                    "instance_class": "db.t3.micro",
-                    "allocated_storage": 20,
-                    "region": "us-east-1"
-                }
-            },
-            "storage": {
-                "name": "app-files",
-                "config": {
-                    "region": "us-east-1",
-                    "storage_class": "STANDARD",
-                    "versioning_enabled": True
-                }
-            }
-        },
-        "azure": {
-            "provider": "azure",
-            "vm": {
-                "name": "web-server",
-                "config": {
-                    "vm_size": "Standard_B1s",
-                    "image": "UbuntuLTS",
-                    "resource_group": "my-rg",
-                    "region": "eastus"
-                }
-            },
-            "database": {
-                "name": "app-db",
-                "config": {
-                    "tier": "Basic",
-                    "server_name": "mydbserver",
-                    "resource_group": "my-rg",
-                    "region": "eastus"
-                }
-            },
-            "storage": {
-                "name": "appfiles",
-                "config": {
-                    "region": "eastus",
-                    "account_type": "Standard_LRS",
-                    "access_tier": "Hot"
-                }
-            }
-        }
-    }
-    
-    return {
-        "description": "Example configurations for different cloud providers",
-        "examples": examples
-    }
\ No newline at end of file
@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Query, HTTPException
+import asyncio
+from fastapi import APIRouter, Query, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 from typing import Optional
 from app.domain.schemas.logs import LogsResponse, LogsQuery, AuditLogEntry
 from app.domain.services.log_service import LogService
+from app.core.http_cache import static_json, static_json_response
 
 router = APIRouter()
 
@@ -10,7 +13,7 @@ log_service = LogService()
 
 
 @router.get("/logs", response_model=LogsResponse)
-def get_audit_logs(
+async def get_audit_logs(
     actor: Optional[str] = Query(None, description="Filtrar por actor"),
     action: Optional[str] = Query(None, description="Filtrar por acción (create, update, delete, start, stop, restart)"),
     provider: Optional[str] = Query(None, description="Filtrar por proveedor (aws, azure, gcp, onpremise, oracle)"),
@@ -31,49 +34,55 @@ def get_audit_logs(
             page_size=page_size
         )
         
-        logs, total = log_service.get_logs(query)
+        # Lectura del fichero de auditoría: bloqueante, fuera del event loop
+        logs, total = await asyncio.to_thread(log_service.get_logs, query)
         
-        return LogsResponse(
-            logs=logs,
-            total=total,
-            page=page,
-            page_size=page_size
-        )
+        # Entradas ya validadas al leer el fichero: se serializan directamente con orjson
+        return ORJSONResponse({
+            "logs": [log.model_dump() for log in logs],
+            "total": total,
+            "page": page,
+            "page_size": page_size
+        })
         
-    except Exception as e:
+    except (OSError, ValueError):
         raise HTTPException(status_code=500, detail="Error reading logs")
 
 
 @router.get("/logs/recent")
-def get_recent_logs(limit: int = Query(100, ge=1, le=500)):
+async def get_recent_logs(limit: int = Query(100, ge=1, le=500)):
     """
     Obtiene los logs más recientes (para dashboard).
     """
     try:
-        logs = log_service.get_recent_logs(limit)
-        return {"logs": logs, "count": len(logs)}
-    except Exception as e:
+        logs = await asyncio.to_thread(log_service.get_recent_logs, limit)
+        return ORJSONResponse({"logs": [log.model_dump() for log in logs], "count": len(logs)})
+    except (OSError, ValueError):
         raise HTTPException(status_code=500, detail="Error reading recent logs")
 
 
 @router.get("/logs/stats")
-def get_log_statistics():
+async def get_log_statistics():
     """
     Obtiene estadísticas de los logs de auditoría.
     """
     try:
-        stats = log_service.get_stats()
-        return stats
-    except Exception as e:
+        stats = await asyncio.to_thread(log_service.get_stats)
+        return ORJSONResponse(stats)
+    except (OSError, ValueError):
         raise HTTPException(status_code=500, detail="Error calculating log statistics")
 
 
+# Valores de filtro fijos: se serializan una sola vez
+_ACTIONS_JSON = static_json({
+    "actions": ["create", "update", "delete", "start", "stop", "restart"],
+    "providers": ["aws", "azure", "gcp", "onpremise", "oracle"]
+})
+
+
 @router.get("/logs/actions")
-def get_available_actions():
+async def get_available_actions(request: Request):
     """
     Obtiene la lista de acciones disponibles para filtrar.
     """
-    return {
-        "actions": ["create", "update", "delete", "start", "stop", "restart"],
-        "providers": ["aws", "azure", "gcp", "onpremise", "oracle"]
-    }
\ No newline at end of file
+    return static_json_response(_ACTIONS_JSON, request)
\ No newline at end of file
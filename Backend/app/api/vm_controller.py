@@ -1,144 +1,177 @@
-from fastapi import APIRouter, Depends, HTTPException
+import logging
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+from uuid import uuid4
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from app.domain.schemas import (
     VMCreateRequest,
+    VMDTO,
+    ProviderEnum,
     VMResponse,
     VMUpdateRequest,
     VMActionRequest,
     VMListResponse,
 )
+from app.core.config import VALIDATE_API_RESPONSE
 from app.core.container import get_vm_service
+from app.core.http_cache import REVALIDATE_CACHE_CONTROL, not_modified
+from app.core.responses import json_response
+from app.domain.ports import VMNotFoundError
 from app.domain.services import VMService
-from app.infrastructure.logger import audit_log
+from app.infrastructure.logger import audit_queue
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# Las revisiones del repositorio en memoria vuelven a empezar al reiniciar el
+# proceso: el ETag incluye este prefijo para no validar copias de otro arranque
+_ETAG_EPOCH = uuid4().hex[:8]
+
+
+def _vm_response(vm: Optional[VMDTO], headers: Optional[dict] = None) -> ORJSONResponse:
+    # response_model queda solo para OpenAPI: la respuesta se serializa sin re-validar
+    return json_response(
+        {"success": True, "vm": vm.model_dump() if vm is not None else None, "error": None},
+        VMResponse,
+        headers
+    )
+
+
+def _cache_headers(etag: str) -> dict:
+    return {"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL}
+
+
+@contextmanager
+def _vm_errors(
+    action: str, actor: Optional[str] = None, vm_id: str = "n/a", provider: str = "unknown"
+) -> Iterator[None]:
+    """
+    Audita el fallo de una ruta de VM y lo traduce en la propia ruta: VM
+    inexistente -> 404, datos inválidos -> 400, cualquier otro error -> 500
+    """
+    try:
+        yield
+    except VMNotFoundError:
+        _audit_failure(action, actor, vm_id, provider, "not_found")
+        raise HTTPException(status_code=404, detail="VM not found") from None
+    except ValueError as e:
+        _audit_failure(action, actor, vm_id, provider, str(e))
+        raise HTTPException(status_code=400, detail=str(e)) from None
+    except Exception:
+        logger.exception("Error no controlado en la acción de VM %s", action)
+        _audit_failure(action, actor, vm_id, provider, "internal_error")
+        raise HTTPException(status_code=500, detail="Internal error") from None
+
+
+def _audit_failure(action: str, actor: Optional[str], vm_id: str, provider: str, error: str) -> None:
+    audit_queue.submit(
+        actor=actor or "system",
+        action=action,
+        vm_id=vm_id,
+        provider=provider,
+        success=False,
+        details={"error": error},
+    )
 
 
 @router.post("/create", response_model=VMResponse)
-def create_vm(
+async def create_vm(
     payload: VMCreateRequest,
     service: VMService = Depends(get_vm_service),
 ):
-    try:
+    with _vm_errors("create", payload.requested_by, provider=payload.provider.value):
         vm = service.create_vm(payload)
-        return VMResponse(success=True, vm=vm)
-    except ValueError as e:
-        # Log de error de validación sin datos sensibles
-        audit_log(
-            actor=payload.requested_by or "system",
-            action="create",
-            vm_id="n/a",
-            provider=payload.provider.value,
-            success=False,
-            details={"error": str(e)},
-        )
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        audit_log(
-            actor=payload.requested_by or "system",
-            action="create",
-            vm_id="n/a",
-            provider=payload.provider.value,
-            success=False,
-            details={"error": "internal_error"},
-        )
-        raise HTTPException(status_code=500, detail="Internal error")
+    return _vm_response(vm)
 
 
 @router.put("/{vm_id}", response_model=VMResponse)
-def update_vm(
+async def update_vm(
     vm_id: str,
     payload: VMUpdateRequest,
     service: VMService = Depends(get_vm_service),
 ):
-    try:
+    with _vm_errors("update", vm_id=vm_id):
         vm = service.update_vm(vm_id, payload)
-        return VMResponse(success=True, vm=vm)
-    except KeyError:
-        audit_log(
-            actor="system",
-            action="update",
-            vm_id=vm_id,
-            provider="unknown",
-            success=False,
-            details={"error": "not_found"},
-        )
-        raise HTTPException(status_code=404, detail="VM not found")
-    except ValueError as e:
-        audit_log(
-            actor="system",
-            action="update",
-            vm_id=vm_id,
-            provider="unknown",
-            success=False,
-            details={"error": str(e)},
-        )
-        raise HTTPException(status_code=400, detail=str(e))
+    return _vm_response(vm)
 
 
 @router.delete("/{vm_id}", response_model=VMResponse)
-def delete_vm(
+async def delete_vm(
     vm_id: str,
     service: VMService = Depends(get_vm_service),
 ):
-    try:
+    with _vm_errors("delete", vm_id=vm_id):
         service.delete_vm(vm_id)
-        return VMResponse(success=True, vm=None)
-    except KeyError:
-        audit_log(
-            actor="system",
-            action="delete",
-            vm_id=vm_id,
-            provider="unknown",
-            success=False,
-            details={"error": "not_found"},
-        )
-        raise HTTPException(status_code=404, detail="VM not found")
+    return _vm_response(None)
 
 
 @router.post("/{vm_id}/action", response_model=VMResponse)
-def action_vm(
+async def action_vm(
     vm_id: str,
     payload: VMActionRequest,
     service: VMService = Depends(get_vm_service),
 ):
-    try:
+    with _vm_errors(payload.action, payload.requested_by, vm_id):
         vm = service.apply_action(vm_id, payload)
-        return VMResponse(success=True, vm=vm)
-    except KeyError:
-        audit_log(
-            actor=payload.requested_by or "system",
-            action=payload.action,
-            vm_id=vm_id,
-            provider="unknown",
-            success=False,
-            details={"error": "not_found"},
-        )
-        raise HTTPException(status_code=404, detail="VM not found")
-    except ValueError as e:
-        audit_log(
-            actor=payload.requested_by or "system",
-            action=payload.action,
-            vm_id=vm_id,
-            provider="unknown",
-            success=False,
-            details={"error": str(e)},
-        )
-        raise HTTPException(status_code=400, detail=str(e))
+    return _vm_response(vm)
 
 
 @router.get("/{vm_id}", response_model=VMResponse)
-def get_vm(
+async def get_vm(
     vm_id: str,
+    request: Request,
     service: VMService = Depends(get_vm_service),
 ):
     try:
         vm = service.get_vm(vm_id)
-        return VMResponse(success=True, vm=vm)
-    except KeyError:
+        version = service.get_vm_version(vm_id)
+    except VMNotFoundError:
         raise HTTPException(status_code=404, detail="VM not found")
+    # El ETag cambia con cada guardado de la VM: si el cliente ya tiene esa
+    # versión se responde 304 sin serializar nada
+    headers = _cache_headers(f'"{_ETAG_EPOCH}:{vm_id}:{version}"')
+    if not_modified(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return _vm_response(vm, headers)
+
+
+async def _stream_vms(vms: List[VMDTO], total: int, page: int, page_size: int):
+    """Emite la página como un array JSON VM a VM (orjson por elemento)"""
+    yield b'{"total":%d,"items":[' % total
+    for index, vm in enumerate(vms):
+        if index:
+            yield b","
+        yield orjson.dumps(vm.model_dump())
+    yield b'],"page":%d,"page_size":%d}' % (page, page_size)
 
 
 @router.get("/", response_model=VMListResponse)
-def list_vms(service: VMService = Depends(get_vm_service)):
-    vms = service.list_vms()
-    return VMListResponse(items=vms)
+async def list_vms(
+    request: Request,
+    provider: Optional[ProviderEnum] = Query(None, description="Filtrar por proveedor"),
+    status: Optional[str] = Query(None, description="Filtrar por estado (running, stopped)"),
+    page: int = Query(1, ge=1, description="Número de página"),
+    page_size: int = Query(100, ge=1, le=500, description="Tamaño de página (máx 500)"),
+    service: VMService = Depends(get_vm_service),
+):
+    provider_code = provider.value if provider else None
+    # Cualquier alta, cambio o borrado avanza la revisión del repositorio; junto
+    # con los parámetros de la consulta identifica el contenido de la página
+    headers = _cache_headers(
+        f'"{_ETAG_EPOCH}:{service.list_revision()}:{provider_code or ""}:{status or ""}:{page}:{page_size}"'
+    )
+    if not_modified(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    vms, total = service.list_vms_page((page - 1) * page_size, page_size, provider_code, status)
+    if VALIDATE_API_RESPONSE:
+        return json_response({
+            "total": total,
+            "items": [vm.model_dump() for vm in vms],
+            "page": page,
+            "page_size": page_size
+        }, VMListResponse, headers)
+    return StreamingResponse(
+        _stream_vms(vms, total, page, page_size), media_type="application/json", headers=headers
+    )
@@ -0,0 +1,14 @@
+import os
+
+
+def _env_flag(name: str, default: str = "false") -> bool:
+    return os.getenv(name, default).strip().lower() in ("1", "true", "yes", "on")
+
+
+# Re-valida las respuestas contra sus modelos Pydantic antes de serializarlas.
+# Desactivado por defecto (producción); activarlo en desarrollo para detectar
+# divergencias entre los dicts construidos y los modelos documentados.
+VALIDATE_API_RESPONSE = _env_flag("VALIDATE_API_RESPONSE")
+
+# Nivel de los logs de diagnóstico de la aplicación (logger "app")
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").strip().upper()
@@ -6,5 +6,6 @@ _repo = VMRepository()
 _service = VMService(repo=_repo)
 
 
-def get_vm_service() -> VMService:
+# async: FastAPI resuelve la dependencia en el event loop, sin pasar por el threadpool
+async def get_vm_service() -> VMService:
     return _service
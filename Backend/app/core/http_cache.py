@@ -0,0 +1,46 @@
+import hashlib
+from typing import Any, NamedTuple, Optional
+
+import orjson
+from fastapi import Request
+from fastapi.responses import Response
+
+# Respuestas que solo cambian al reiniciar el proceso (o registrar una factory)
+CACHE_CONTROL = "public, max-age=3600"
+# Datos mutables: el cliente puede guardarlos pero debe revalidar con If-None-Match
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+class StaticJSON(NamedTuple):
+    """Cuerpo JSON ya serializado junto con su ETag"""
+    body: bytes
+    etag: str
+
+
+def static_json(content: Any) -> StaticJSON:
+    body = orjson.dumps(content)
+    return StaticJSON(body, f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"')
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def not_modified(request: Optional[Request], etag: str) -> bool:
+    """True si el If-None-Match de la petición incluye el ETag dado"""
+    if request is None:
+        return False
+    if_none_match = request.headers.get("if-none-match")
+    return bool(if_none_match) and _etag_matches(if_none_match, etag)
+
+
+def static_json_response(static: StaticJSON, request: Optional[Request] = None) -> Response:
+    """200 con el cuerpo cacheado, o 304 sin cuerpo si el cliente ya tiene esa versión"""
+    headers = {"ETag": static.etag, "Cache-Control": CACHE_CONTROL}
+    if not_modified(request, static.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=static.body, media_type="application/json", headers=headers)
@@ -0,0 +1,21 @@
+from typing import Any, Dict, Mapping, Optional, Type
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+from app.core.config import VALIDATE_API_RESPONSE
+
+
+def json_response(
+    content: Dict[str, Any],
+    model: Optional[Type[BaseModel]] = None,
+    headers: Optional[Mapping[str, str]] = None
+) -> ORJSONResponse:
+    """
+    Serializa directamente con orjson, evitando la segunda validación de
+    response_model sobre datos construidos internamente.
+    Con VALIDATE_API_RESPONSE activo se re-valida contra el modelo (desarrollo).
+    """
+    if VALIDATE_API_RESPONSE and model is not None:
+        content = model.model_validate(content).model_dump(mode="json")
+    return ORJSONResponse(content=content, headers=headers)
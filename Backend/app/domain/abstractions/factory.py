@@ -4,9 +4,12 @@ Esta es la interfaz principal del patrón Abstract Factory.
 """
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 from .products import VirtualMachine, Database, LoadBalancer, Storage
 
+_NO_FIELDS: frozenset = frozenset()
+
 
 class CloudAbstractFactory(ABC):
     """
@@ -17,6 +20,70 @@ class CloudAbstractFactory(ABC):
     para crear productos específicos de su plataforma.
     """
     
+    # Sin estado por instancia: toda la configuración vive en la clase
+    __slots__ = ()
+    
+    # Capacidades opcionales que la factory concreta expone (ver get_supported_*)
+    CAPABILITIES: frozenset = frozenset()
+    
+    # Campos obligatorios por recurso ("vm", "database", "load_balancer", "storage")
+    REQUIRED_FIELDS: Mapping[str, frozenset] = MappingProxyType({})
+    
+    # Mensaje de error por campos faltantes: admite {resource}, {fields} (lista)
+    # y {field_names} (separados por comas)
+    MISSING_FIELDS_ERROR = "Missing required fields for {resource}: {fields}"
+    
+    # Valores permitidos por recurso: tuplas (campo, valor por defecto, valores
+    # válidos, mensaje con {value}). Se comprueban tras los campos obligatorios
+    ALLOWED_VALUES: Mapping[str, Tuple[Tuple[str, Any, frozenset, str], ...]] = MappingProxyType({})
+    
+    # Mínimos numéricos por recurso: tuplas (campo, valor por defecto, mínimo,
+    # mensaje). Se comprueban en orden y falla la primera que no se cumpla
+    MINIMUM_VALUES: Mapping[str, Tuple[Tuple[str, Any, Any, str], ...]] = MappingProxyType({})
+    
+    # Atributos opcionales por recurso que se copian de la config al producto
+    # cuando vienen en ella (mismo nombre en la config y en el producto)
+    OPTIONAL_FIELDS: Mapping[str, Tuple[str, ...]] = MappingProxyType({})
+    
+    _RESOURCE_LABELS = MappingProxyType({
+        "vm": "VM",
+        "database": "Database",
+        "load_balancer": "Load Balancer",
+        "storage": "Storage"
+    })
+    
+    def _validate_required(self, resource: str, config: Dict[str, Any]) -> None:
+        """Lanza ValueError si falta algún campo obligatorio del recurso"""
+        # Diferencia de conjuntos en C; solo se ordena/formatea si hay error
+        missing = self.REQUIRED_FIELDS.get(resource, _NO_FIELDS).difference(config)
+        if missing:
+            raise self._missing_fields_error(resource, missing)
+    
+    def _missing_fields_error(self, resource: str, missing: frozenset) -> ValueError:
+        fields = sorted(missing)
+        return ValueError(self.MISSING_FIELDS_ERROR.format(
+            resource=self._RESOURCE_LABELS[resource],
+            fields=fields,
+            field_names=", ".join(fields)
+        ))
+    
+    def _validate_resource(self, resource: str, config: Dict[str, Any]) -> None:
+        """Valida un recurso contra las tablas REQUIRED_FIELDS, ALLOWED_VALUES y MINIMUM_VALUES"""
+        self._validate_required(resource, config)
+        for field, default, allowed, message in self.ALLOWED_VALUES.get(resource, ()):
+            value = config.get(field, default)
+            if value not in allowed:
+                raise ValueError(message.format(value=value))
+        for field, default, minimum, message in self.MINIMUM_VALUES.get(resource, ()):
+            if config.get(field, default) < minimum:
+                raise ValueError(message)
+    
+    def _apply_optional_fields(self, resource: str, product: Any, config: Dict[str, Any]) -> None:
+        """Asigna al producto los OPTIONAL_FIELDS del recurso presentes en la config"""
+        for field in self.OPTIONAL_FIELDS.get(resource, ()):
+            if field in config:
+                setattr(product, field, config[field])
+    
     @abstractmethod
     def create_virtual_machine(
         self, 
@@ -64,6 +131,15 @@ class CloudAbstractFactory(ABC):
         pass
 
 
+# Recursos que create_infrastructure construye: (clave en la config, método de la factory)
+_INFRASTRUCTURE_STEPS = (
+    ("vm", "create_virtual_machine"),
+    ("database", "create_database"),
+    ("load_balancer", "create_load_balancer"),
+    ("storage", "create_storage"),
+)
+
+
 class CloudResourceManager:
     """
     Clase que utiliza el Abstract Factory para gestionar recursos de cloud.
@@ -84,42 +160,14 @@ class CloudResourceManager:
         familias de productos relacionados.
         """
         infrastructure = {}
-        
-        # Crear VM si está especificada
-        if 'vm' in config:
-            vm = self._factory.create_virtual_machine(
-                name=config['vm']['name'],
-                vm_config=config['vm']['config']
-            )
-            infrastructure['vm'] = vm
-            self._resources[vm.resource_id] = vm
-        
-        # Crear Database si está especificada
-        if 'database' in config:
-            db = self._factory.create_database(
-                name=config['database']['name'],
-                db_config=config['database']['config']
-            )
-            infrastructure['database'] = db
-            self._resources[db.resource_id] = db
-        
-        # Crear Load Balancer si está especificado
-        if 'load_balancer' in config:
-            lb = self._factory.create_load_balancer(
-                name=config['load_balancer']['name'],
-                lb_config=config['load_balancer']['config']
-            )
-            infrastructure['load_balancer'] = lb
-            self._resources[lb.resource_id] = lb
-        
-        # Crear Storage si está especificado
-        if 'storage' in config:
-            storage = self._factory.create_storage(
-                name=config['storage']['name'],
-                storage_config=config['storage']['config']
-            )
-            infrastructure['storage'] = storage
-            self._resources[storage.resource_id] = storage
+        for key, method in _INFRASTRUCTURE_STEPS:
+            spec = config.get(key)
+            if spec is None:
+                continue
+            # Argumentos posicionales: no todas las factories usan el mismo nombre de parámetro
+            resource = getattr(self._factory, method)(spec['name'], spec['config'])
+            infrastructure[key] = resource
+            self._resources[resource.resource_id] = resource
         
         return infrastructure
     
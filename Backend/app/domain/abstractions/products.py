@@ -4,6 +4,7 @@ These define the interfaces for the different types of cloud resources.
 """
 from __future__ import annotations
 from abc import ABC, abstractmethod
+import uuid
 from typing import Dict, Any, Optional
 from enum import Enum
 
@@ -17,9 +18,21 @@ class ResourceStatus(str, Enum):
     ERROR = "error"
 
 
+def _resource_name(name: Optional[str], config: Dict[str, Any], prefix: str) -> str:
+    """Nombre explícito, el de la config o uno generado (el uuid solo se crea si hace falta)"""
+    if name is not None:
+        return name
+    if "name" in config:
+        return config["name"]
+    return f"{prefix}-{uuid.uuid4().hex[:6]}"
+
+
 class CloudResource(ABC):
     """Producto abstracto base para todos los recursos en la nube"""
     
+    # Sin __dict__ por instancia: cada subclase declara sus propios __slots__
+    __slots__ = ("resource_id", "name", "region", "status", "tags")
+    
     def __init__(self, resource_id: str, name: str, region: str):
         self.resource_id = resource_id
         self.name = name
@@ -41,6 +54,8 @@ class CloudResource(ABC):
 class VirtualMachine(CloudResource):
     """Producto abstracto para máquinas virtuales"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def start(self) -> None:
         """Inicia la máquina virtual"""
@@ -65,6 +80,8 @@ class VirtualMachine(CloudResource):
 class Database(CloudResource):
     """Producto abstracto para bases de datos"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def backup(self) -> str:
         """Crea un backup de la base de datos"""
@@ -84,6 +101,8 @@ class Database(CloudResource):
 class LoadBalancer(CloudResource):
     """Producto abstracto para balanceadores de carga"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def add_target(self, target_id: str) -> None:
         """Añade un target al balanceador"""
@@ -103,6 +122,8 @@ class LoadBalancer(CloudResource):
 class Storage(CloudResource):
     """Producto abstracto para almacenamiento"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def create_bucket(self, bucket_name: str) -> None:
         """Crea un bucket/contenedor"""
@@ -122,6 +143,8 @@ class Storage(CloudResource):
 class NetworkInterface(ABC):
     """Interfaz abstracta para componentes de red"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def configure_security_group(self, rules: Dict[str, Any]) -> None:
         """Configura las reglas de seguridad"""
@@ -2,11 +2,16 @@
 Fábrica concreta de AWS que implementa el Abstract Factory.
 Crea familias de productos específicos de AWS que trabajan juntos.
 """
-from typing import Dict, Any
+import logging
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, FrozenSet, Mapping, Tuple
 from ..abstractions.factory import CloudAbstractFactory
 from ..abstractions.products import VirtualMachine, Database, LoadBalancer, Storage
 from ..products.aws_products import EC2Instance, RDSDatabase, ApplicationLoadBalancer, S3Storage
 
+# Trazas de diagnóstico: formateo diferido, sin escribir en stdout por petición
+logger = logging.getLogger(__name__)
+
 
 class AWSCloudFactory(CloudAbstractFactory):
     """
@@ -14,20 +19,59 @@ class AWSCloudFactory(CloudAbstractFactory):
     Implementa el Abstract Factory pattern para AWS.
     """
     
-    def __init__(self):
-        self._supported_regions = {
-            "us-east-1", "us-west-1", "us-west-2", "eu-west-1", 
-            "eu-central-1", "ap-southeast-1", "ap-northeast-1"
-        }
+    __slots__ = ()
+    
+    # Métodos opcionales de capacidades expuestos en /providers/{provider}/info
+    CAPABILITIES = frozenset({"regions", "instance_types"})
+    
+    # Datos estáticos compartidos por todas las instancias (sin copias por llamada)
+    _SUPPORTED_REGIONS: ClassVar[FrozenSet[str]] = frozenset({
+        "us-east-1", "us-west-1", "us-west-2", "eu-west-1",
+        "eu-central-1", "ap-southeast-1", "ap-northeast-1"
+    })
+    _RECOMMENDED_INSTANCE_TYPES: ClassVar[Mapping[str, Tuple[str, ...]]] = MappingProxyType({
+        "general": ("t3.micro", "t3.small", "t3.medium", "m5.large"),
+        "compute": ("c5.large", "c5.xlarge", "c5.2xlarge"),
+        "memory": ("r5.large", "r5.xlarge", "r5.2xlarge"),
+        "storage": ("i3.large", "i3.xlarge", "d2.xlarge")
+    })
+    _PROVIDER_INFO: ClassVar[Mapping[str, Any]] = MappingProxyType({
+        "name": "Amazon Web Services",
+        "code": "aws",
+        "supported_regions": _SUPPORTED_REGIONS,
+        "services": MappingProxyType({
+            "compute": "EC2 Instances",
+            "database": "RDS",
+            "load_balancer": "Application Load Balancer",
+            "storage": "S3"
+        })
+    })
+    
+    MISSING_FIELDS_ERROR = "Missing required fields for AWS: {fields}"
+    REQUIRED_FIELDS = MappingProxyType({
+        "vm": frozenset({"instance_type", "ami", "vpc_id", "region"}),
+        "database": frozenset({"engine", "instance_class", "allocated_storage", "region"}),
+        "load_balancer": frozenset({"vpc_id", "region"}),
+        "storage": frozenset({"region"})
+    })
+    
+    _REGION_RULE = ("region", None, _SUPPORTED_REGIONS, "Region {value} not supported by AWS")
+    ALLOWED_VALUES = MappingProxyType({
+        "vm": (_REGION_RULE,),
+        "database": (_REGION_RULE,),
+        "load_balancer": (_REGION_RULE,),
+        "storage": (_REGION_RULE,)
+    })
+    OPTIONAL_FIELDS = MappingProxyType({
+        "vm": ("security_groups", "key_pair"),
+        "load_balancer": ("listeners",)
+    })
     
     def create_virtual_machine(self, name: str, vm_config: Dict[str, Any]) -> VirtualMachine:
         """Crea una instancia EC2"""
-        required_fields = ["instance_type", "ami", "vpc_id", "region"]
-        self._validate_config(vm_config, required_fields)
+        self._validate_resource("vm", vm_config)
         
         region = vm_config["region"]
-        if not self.validate_region(region):
-            raise ValueError(f"Region {region} not supported by AWS")
         
         vm = EC2Instance(
             name=name,
@@ -38,22 +82,16 @@ class AWSCloudFactory(CloudAbstractFactory):
         )
         
         # Configuraciones opcionales
-        if "security_groups" in vm_config:
-            vm.security_groups = vm_config["security_groups"]
-        if "key_pair" in vm_config:
-            vm.key_pair = vm_config["key_pair"]
+        self._apply_optional_fields("vm", vm, vm_config)
         
-        print(f"🏭 AWS Factory: Created EC2 Instance {name} ({vm_config['instance_type']})")
+        logger.debug("AWS Factory: Created EC2 Instance %s (%s)", name, vm_config["instance_type"])
         return vm
     
     def create_database(self, name: str, db_config: Dict[str, Any]) -> Database:
         """Crea una instancia RDS"""
-        required_fields = ["engine", "instance_class", "allocated_storage", "region"]
-        self._validate_config(db_config, required_fields)
+        self._validate_resource("database", db_config)
         
         region = db_config["region"]
-        if not self.validate_region(region):
-            raise ValueError(f"Region {region} not supported by AWS")
         
         db = RDSDatabase(
             name=name,
@@ -63,17 +101,14 @@ class AWSCloudFactory(CloudAbstractFactory):
             allocated_storage=db_config["allocated_storage"]
         )
         
-        print(f"🏭 AWS Factory: Created RDS Database {name} ({db_config['engine']})")
+        logger.debug("AWS Factory: Created RDS Database %s (%s)", name, db_config["engine"])
         return db
     
     def create_load_balancer(self, name: str, lb_config: Dict[str, Any]) -> LoadBalancer:
         """Crea un Application Load Balancer"""
-        required_fields = ["vpc_id", "region"]
-        self._validate_config(lb_config, required_fields)
+        self._validate_resource("load_balancer", lb_config)
         
         region = lb_config["region"]
-        if not self.validate_region(region):
-            raise ValueError(f"Region {region} not supported by AWS")
         
         lb = ApplicationLoadBalancer(
             name=name,
@@ -82,21 +117,17 @@ class AWSCloudFactory(CloudAbstractFactory):
             scheme=lb_config.get("scheme", "internet-facing")
         )
         
-        # Configurar listeners por defecto
-        if "listeners" in lb_config:
-            lb.listeners = lb_config["listeners"]
+        # Configurar listeners si se especifican
+        self._apply_optional_fields("load_balancer", lb, lb_config)
         
-        print(f"🏭 AWS Factory: Created Application Load Balancer {name}")
+        logger.debug("AWS Factory: Created Application Load Balancer %s", name)
         return lb
     
     def create_storage(self, name: str, storage_config: Dict[str, Any]) -> Storage:
         """Crea un bucket S3"""
-        required_fields = ["region"]
-        self._validate_config(storage_config, required_fields)
+        self._validate_resource("storage", storage_config)
         
         region = storage_config["region"]
-        if not self.validate_region(region):
-            raise ValueError(f"Region {region} not supported by AWS")
         
         storage = S3Storage(
             name=name,
@@ -108,22 +139,12 @@ class AWSCloudFactory(CloudAbstractFactory):
         if storage_config.get("versioning_enabled"):
             storage.versioning_enabled = True
         
-        print(f"🏭 AWS Factory: Created S3 Bucket {name}")
+        logger.debug("AWS Factory: Created S3 Bucket %s", name)
         return storage
     
-    def get_provider_info(self) -> Dict[str, Any]:
-        """Retorna información completa sobre el proveedor AWS"""
-        return {
-            "name": "Amazon Web Services",
-            "code": "aws",
-            "supported_regions": self._supported_regions,
-            "services": {
-                "compute": "EC2 Instances",
-                "database": "RDS",
-                "load_balancer": "Application Load Balancer",
-                "storage": "S3"
-            }
-        }
+    def get_provider_info(self) -> Mapping[str, Any]:
+        """Retorna información completa sobre el proveedor AWS (vista de solo lectura)"""
+        return self._PROVIDER_INFO
     
     def get_provider_name(self) -> str:
         """Retorna el nombre del proveedor"""
@@ -131,23 +152,12 @@ class AWSCloudFactory(CloudAbstractFactory):
     
     def validate_region(self, region: str) -> bool:
         """Valida si la región es soportada por AWS"""
-        return region in self._supported_regions
-    
-    def _validate_config(self, config: Dict[str, Any], required_fields: list) -> None:
-        """Valida que la configuración tenga los campos requeridos"""
-        missing_fields = [field for field in required_fields if field not in config]
-        if missing_fields:
-            raise ValueError(f"Missing required fields for AWS: {missing_fields}")
+        return region in self._SUPPORTED_REGIONS
     
-    def get_supported_regions(self) -> set:
-        """Retorna las regiones soportadas"""
-        return self._supported_regions.copy()
+    def get_supported_regions(self) -> FrozenSet[str]:
+        """Retorna las regiones soportadas (inmutable, sin copia)"""
+        return self._SUPPORTED_REGIONS
     
-    def get_recommended_instance_types(self) -> Dict[str, list]:
-        """Retorna tipos de instancia recomendados por caso de uso"""
-        return {
-            "general": ["t3.micro", "t3.small", "t3.medium", "m5.large"],
-            "compute": ["c5.large", "c5.xlarge", "c5.2xlarge"],
-            "memory": ["r5.large", "r5.xlarge", "r5.2xlarge"],
-            "storage": ["i3.large", "i3.xlarge", "d2.xlarge"]
-        }
\ No newline at end of file
+    def get_recommended_instance_types(self) -> Mapping[str, Tuple[str, ...]]:
+        """Retorna tipos de instancia recomendados por caso de uso (vista de solo lectura)"""
+        return self._RECOMMENDED_INSTANCE_TYPES
\ No newline at end of file
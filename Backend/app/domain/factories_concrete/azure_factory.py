@@ -2,11 +2,16 @@
 Fábrica concreta de Azure que implementa el Abstract Factory.
 Crea familias de productos específicos de Azure que trabajan juntos.
 """
-from typing import Dict, Any
+import logging
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, FrozenSet, Mapping, Tuple
 from ..abstractions.factory import CloudAbstractFactory
 from ..abstractions.products import VirtualMachine, Database, LoadBalancer, Storage
 from ..products.azure_products import AzureVirtualMachine, AzureSQLDatabase, AzureLoadBalancer, AzureBlobStorage
 
+# Trazas de diagnóstico: formateo diferido, sin escribir en stdout por petición
+logger = logging.getLogger(__name__)
+
 
 class AzureCloudFactory(CloudAbstractFactory):
     """
@@ -14,20 +19,61 @@ class AzureCloudFactory(CloudAbstractFactory):
     Implementa el Abstract Factory pattern para Azure.
     """
     
-    def __init__(self):
-        self._supported_regions = {
-            "eastus", "westus", "westus2", "northeurope", "westeurope",
-            "southeastasia", "eastasia", "japaneast", "australiaeast"
-        }
+    __slots__ = ()
+    
+    # Métodos opcionales de capacidades expuestos en /providers/{provider}/info
+    CAPABILITIES = frozenset({"regions", "vm_sizes"})
+    
+    # Datos estáticos compartidos por todas las instancias (sin copias por llamada)
+    _SUPPORTED_REGIONS: ClassVar[FrozenSet[str]] = frozenset({
+        "eastus", "westus", "westus2", "northeurope", "westeurope",
+        "southeastasia", "eastasia", "japaneast", "australiaeast"
+    })
+    _RECOMMENDED_VM_SIZES: ClassVar[Mapping[str, Tuple[str, ...]]] = MappingProxyType({
+        "general": ("Standard_B1s", "Standard_B2s", "Standard_D2s_v3"),
+        "compute": ("Standard_F2s_v2", "Standard_F4s_v2", "Standard_F8s_v2"),
+        "memory": ("Standard_E2s_v3", "Standard_E4s_v3", "Standard_E8s_v3"),
+        "storage": ("Standard_L4s", "Standard_L8s", "Standard_L16s")
+    })
+    _PROVIDER_INFO: ClassVar[Mapping[str, Any]] = MappingProxyType({
+        "name": "Microsoft Azure",
+        "code": "azure",
+        "supported_regions": _SUPPORTED_REGIONS,
+        "services": MappingProxyType({
+            "compute": "Virtual Machines",
+            "database": "Azure SQL Database",
+            "load_balancer": "Azure Load Balancer",
+            "storage": "Blob Storage"
+        })
+    })
+    
+    MISSING_FIELDS_ERROR = "Missing required fields for Azure: {fields}"
+    REQUIRED_FIELDS = MappingProxyType({
+        "vm": frozenset({"vm_size", "image", "resource_group", "region"}),
+        "database": frozenset({"tier", "server_name", "resource_group", "region"}),
+        "load_balancer": frozenset({"resource_group", "region"}),
+        "storage": frozenset({"region"})
+    })
+    
+    _REGION_RULE = ("region", None, _SUPPORTED_REGIONS, "Region {value} not supported by Azure")
+    ALLOWED_VALUES = MappingProxyType({
+        "vm": (_REGION_RULE,),
+        "database": (_REGION_RULE,),
+        "load_balancer": (_REGION_RULE,),
+        "storage": (_REGION_RULE,)
+    })
+    OPTIONAL_FIELDS = MappingProxyType({
+        "vm": ("virtual_network", "network_security_group"),
+        "database": ("max_size_gb",),
+        "load_balancer": ("frontend_ip_configs",),
+        "storage": ("access_tier",)
+    })
     
     def create_virtual_machine(self, name: str, vm_config: Dict[str, Any]) -> VirtualMachine:
         """Crea una VM de Azure"""
-        required_fields = ["vm_size", "image", "resource_group", "region"]
-        self._validate_config(vm_config, required_fields)
+        self._validate_resource("vm", vm_config)
         
         region = vm_config["region"]
-        if not self.validate_region(region):
-            raise ValueError(f"Region {region} not supported by Azure")
         
         vm = AzureVirtualMachine(
             name=name,
@@ -38,22 +84,16 @@ class AzureCloudFactory(CloudAbstractFactory):
         )
         
         # Configuraciones opcionales
-        if "virtual_network" in vm_config:
-            vm.virtual_network = vm_config["virtual_network"]
-        if "network_security_group" in vm_config:
-            vm.network_security_group = vm_config["network_security_group"]
+        self._apply_optional_fields("vm", vm, vm_config)
         
-        print(f"🏭 Azure Factory: Created VM {name} ({vm_config['vm_size']})")
+        logger.debug("Azure Factory: Created VM %s (%s)", name, vm_config["vm_size"])
         return vm
     
     def create_database(self, name: str, db_config: Dict[str, Any]) -> Database:
         """Crea una Azure SQL Database"""
-        required_fields = ["tier", "server_name", "resource_group", "region"]
-        self._validate_config(db_config, required_fields)
+        self._validate_resource("database", db_config)
         
         region = db_config["region"]
-        if not self.validate_region(region):
-            raise ValueError(f"Region {region} not supported by Azure")
         
         db = AzureSQLDatabase(
             name=name,
@@ -63,20 +103,16 @@ class AzureCloudFactory(CloudAbstractFactory):
             resource_group=db_config["resource_group"]
         )
         
-        if "max_size_gb" in db_config:
-            db.max_size_gb = db_config["max_size_gb"]
+        self._apply_optional_fields("database", db, db_config)
         
-        print(f"🏭 Azure Factory: Created SQL Database {name} ({db_config['tier']})")
+        logger.debug("Azure Factory: Created SQL Database %s (%s)", name, db_config["tier"])
         return db
     
     def create_load_balancer(self, name: str, lb_config: Dict[str, Any]) -> LoadBalancer:
         """Crea un Azure Load Balancer"""
-        required_fields = ["resource_group", "region"]
-        self._validate_config(lb_config, required_fields)
+        self._validate_resource("load_balancer", lb_config)
         
         region = lb_config["region"]
-        if not self.validate_region(region):
-            raise ValueError(f"Region {region} not supported by Azure")
         
         lb = AzureLoadBalancer(
             name=name,
@@ -86,20 +122,16 @@ class AzureCloudFactory(CloudAbstractFactory):
         )
         
         # Configurar frontend IP si se especifica
-        if "frontend_ip_configs" in lb_config:
-            lb.frontend_ip_configs = lb_config["frontend_ip_configs"]
+        self._apply_optional_fields("load_balancer", lb, lb_config)
         
-        print(f"🏭 Azure Factory: Created Load Balancer {name}")
+        logger.debug("Azure Factory: Created Load Balancer %s", name)
         return lb
     
     def create_storage(self, name: str, storage_config: Dict[str, Any]) -> Storage:
         """Crea una cuenta de almacenamiento Azure Blob"""
-        required_fields = ["region"]
-        self._validate_config(storage_config, required_fields)
+        self._validate_resource("storage", storage_config)
         
         region = storage_config["region"]
-        if not self.validate_region(region):
-            raise ValueError(f"Region {region} not supported by Azure")
         
         storage = AzureBlobStorage(
             name=name,
@@ -108,25 +140,14 @@ class AzureCloudFactory(CloudAbstractFactory):
         )
         
         # Configurar access tier si se especifica
-        if "access_tier" in storage_config:
-            storage.access_tier = storage_config["access_tier"]
+        self._apply_optional_fields("storage", storage, storage_config)
         
-        print(f"🏭 Azure Factory: Created Blob Storage {name}")
+        logger.debug("Azure Factory: Created Blob Storage %s", name)
         return storage
     
-    def get_provider_info(self) -> Dict[str, Any]:
-        """Retorna información completa sobre el proveedor Azure"""
-        return {
-            "name": "Microsoft Azure",
-            "code": "azure",
-            "supported_regions": self._supported_regions,
-            "services": {
-                "compute": "Virtual Machines",
-                "database": "Azure SQL Database",
-                "load_balancer": "Azure Load Balancer",
-                "storage": "Blob Storage"
-            }
-        }
+    def get_provider_info(self) -> Mapping[str, Any]:
+        """Retorna información completa sobre el proveedor Azure (vista de solo lectura)"""
+        return self._PROVIDER_INFO
     
     def get_provider_name(self) -> str:
         """Retorna el nombre del proveedor"""
@@ -134,23 +155,12 @@ class AzureCloudFactory(CloudAbstractFactory):
     
     def validate_region(self, region: str) -> bool:
         """Valida si la región es soportada por Azure"""
-        return region in self._supported_regions
-    
-    def _validate_config(self, config: Dict[str, Any], required_fields: list) -> None:
-        """Valida que la configuración tenga los campos requeridos"""
-        missing_fields = [field for field in required_fields if field not in config]
-        if missing_fields:
-            raise ValueError(f"Missing required fields for Azure: {missing_fields}")
+        return region in self._SUPPORTED_REGIONS
     
-    def get_supported_regions(self) -> set:
-        """Retorna las regiones soportadas"""
-        return self._supported_regions.copy()
+    def get_supported_regions(self) -> FrozenSet[str]:
+        """Retorna las regiones soportadas (inmutable, sin copia)"""
+        return self._SUPPORTED_REGIONS
     
-    def get_recommended_vm_sizes(self) -> Dict[str, list]:
-        """Retorna tamaños de VM recomendados por caso de uso"""
-        return {
-            "general": ["Standard_B1s", "Standard_B2s", "Standard_D2s_v3"],
-            "compute": ["Standard_F2s_v2", "Standard_F4s_v2", "Standard_F8s_v2"],
-            "memory": ["Standard_E2s_v3", "Standard_E4s_v3", "Standard_E8s_v3"],
-            "storage": ["Standard_L4s", "Standard_L8s", "Standard_L16s"]
-        }
\ No newline at end of file
+    def get_recommended_vm_sizes(self) -> Mapping[str, Tuple[str, ...]]:
+        """Retorna tamaños de VM recomendados por caso de uso (vista de solo lectura)"""
+        return self._RECOMMENDED_VM_SIZES
\ No newline at end of file
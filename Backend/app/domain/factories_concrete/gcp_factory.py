@@ -1,9 +1,14 @@
 
-from typing import Dict, Any
+import logging
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, FrozenSet, Mapping, Tuple
 from ..abstractions.factory import CloudAbstractFactory
 from ..abstractions.products import VirtualMachine, Database, LoadBalancer, Storage
 from ..products.gcp_products import ComputeEngineInstance, CloudSQLDatabase, CloudLoadBalancer, CloudStorage
 
+# Trazas de diagnóstico: formateo diferido, sin escribir en stdout por petición
+logger = logging.getLogger(__name__)
+
 
 class GCPCloudFactory(CloudAbstractFactory):
     """
@@ -11,12 +16,60 @@ class GCPCloudFactory(CloudAbstractFactory):
     Implementa el Abstract Factory pattern para GCP.
     """
     
-    def __init__(self):
-        self.provider_name = "gcp"
-        self.supported_regions = [
-            "us-central1", "us-east1", "us-west1", "us-west2",
-            "europe-west1", "europe-west2", "asia-east1", "asia-southeast1"
-        ]
+    __slots__ = ()
+    
+    # Métodos opcionales de capacidades expuestos en /providers/{provider}/info
+    CAPABILITIES = frozenset({"machine_types", "database_engines", "load_balancer_types", "storage_classes", "locations"})
+    
+    provider_name = "gcp"
+    
+    # Datos estáticos compartidos por todas las instancias: tuplas ordenadas para
+    # las respuestas y frozensets para las comprobaciones de pertenencia
+    _SUPPORTED_REGIONS: ClassVar[Tuple[str, ...]] = (
+        "us-central1", "us-east1", "us-west1", "us-west2",
+        "europe-west1", "europe-west2", "asia-east1", "asia-southeast1"
+    )
+    _REGION_SET: ClassVar[FrozenSet[str]] = frozenset(_SUPPORTED_REGIONS)
+    _MACHINE_TYPES: ClassVar[Tuple[str, ...]] = (
+        "e2-micro", "e2-small", "e2-medium", "e2-standard-2", "e2-standard-4",
+        "n1-standard-1", "n1-standard-2", "n1-standard-4", "n1-standard-8",
+        "n2-standard-2", "n2-standard-4", "n2-standard-8"
+    )
+    _MACHINE_TYPE_SET: ClassVar[FrozenSet[str]] = frozenset(_MACHINE_TYPES)
+    _DATABASE_ENGINES: ClassVar[Tuple[str, ...]] = ("mysql", "postgres", "sqlserver")
+    _DATABASE_ENGINE_SET: ClassVar[FrozenSet[str]] = frozenset(_DATABASE_ENGINES)
+    _LOAD_BALANCER_TYPES: ClassVar[Tuple[str, ...]] = ("HTTP(S)", "TCP", "UDP", "SSL")
+    _LOAD_BALANCER_TYPE_SET: ClassVar[FrozenSet[str]] = frozenset(_LOAD_BALANCER_TYPES)
+    _STORAGE_CLASSES: ClassVar[Tuple[str, ...]] = ("STANDARD", "NEARLINE", "COLDLINE", "ARCHIVE")
+    _STORAGE_CLASS_SET: ClassVar[FrozenSet[str]] = frozenset(_STORAGE_CLASSES)
+    _LOCATIONS: ClassVar[Tuple[str, ...]] = ("US", "EU", "ASIA") + _SUPPORTED_REGIONS
+    _LOCATION_SET: ClassVar[FrozenSet[str]] = frozenset(_LOCATIONS)
+    _PROVIDER_INFO: ClassVar[Mapping[str, Any]] = MappingProxyType({
+        "name": "Google Cloud Platform",
+        "code": "gcp",
+        "supported_regions": _SUPPORTED_REGIONS,
+        "services": MappingProxyType({
+            "compute": "Compute Engine",
+            "database": "Cloud SQL",
+            "load_balancer": "Cloud Load Balancing",
+            "storage": "Cloud Storage"
+        })
+    })
+    
+    MISSING_FIELDS_ERROR = "Campo requerido faltante para GCP {resource}: {field_names}"
+    REQUIRED_FIELDS = MappingProxyType({
+        "vm": frozenset({"machine_type"}),
+        "database": frozenset({"engine"})
+    })
+    ALLOWED_VALUES = MappingProxyType({
+        "vm": (("machine_type", None, _MACHINE_TYPE_SET, "Machine type inválido para GCP: {value}"),),
+        "database": (("engine", None, _DATABASE_ENGINE_SET, "Engine de base de datos inválido para GCP: {value}"),),
+        "load_balancer": (("type", "HTTP(S)", _LOAD_BALANCER_TYPE_SET, "Tipo de load balancer inválido para GCP: {value}"),),
+        "storage": (
+            ("storage_class", "STANDARD", _STORAGE_CLASS_SET, "Storage class inválido para GCP: {value}"),
+            ("location", "US", _LOCATION_SET, "Ubicación inválida para GCP Storage: {value}")
+        )
+    })
     
     def create_virtual_machine(self, name: str, config: Dict[str, Any]) -> VirtualMachine:
         """
@@ -29,13 +82,11 @@ class GCPCloudFactory(CloudAbstractFactory):
             ComputeEngineInstance: Nueva instancia de VM de GCP
         """
         # Validar configuración específica de GCP
-        self._validate_vm_config(config)
-        config = config.copy()
-        config["name"] = name
+        self._validate_resource("vm", config)
         
         # Crear la instancia de Compute Engine
-        vm = ComputeEngineInstance(config)
-        print(f"🏭 GCP Factory: Creando Compute Engine instance {vm.name}")
+        vm = ComputeEngineInstance(config, name)
+        logger.debug("GCP Factory: Creando Compute Engine instance %s", vm.name)
         
         return vm
     
@@ -50,13 +101,11 @@ class GCPCloudFactory(CloudAbstractFactory):
             CloudSQLDatabase: Nueva instancia de base de datos de GCP
         """
         # Validar configuración específica de GCP
-        self._validate_database_config(config)
-        config = config.copy()
-        config["name"] = name
+        self._validate_resource("database", config)
         
         # Crear la instancia de Cloud SQL
-        database = CloudSQLDatabase(config)
-        print(f"🏭 GCP Factory: Creando Cloud SQL database {database.name}")
+        database = CloudSQLDatabase(config, name)
+        logger.debug("GCP Factory: Creando Cloud SQL database %s", database.name)
         
         return database
     
@@ -71,13 +120,11 @@ class GCPCloudFactory(CloudAbstractFactory):
             CloudLoadBalancer: Nueva instancia de load balancer de GCP
         """
         # Validar configuración específica de GCP
-        self._validate_load_balancer_config(config)
-        config = config.copy()
-        config["name"] = name
+        self._validate_resource("load_balancer", config)
         
         # Crear el Load Balancer
-        load_balancer = CloudLoadBalancer(config)
-        print(f"🏭 GCP Factory: Creando Cloud Load Balancer {load_balancer.name}")
+        load_balancer = CloudLoadBalancer(config, name)
+        logger.debug("GCP Factory: Creando Cloud Load Balancer %s", load_balancer.name)
         
         return load_balancer
     
@@ -92,29 +139,17 @@ class GCPCloudFactory(CloudAbstractFactory):
             CloudStorage: Nueva instancia de storage de GCP
         """
         # Validar configuración específica de GCP
-        self._validate_storage_config(config)
-        config = config.copy()
-        config["name"] = name
+        self._validate_resource("storage", config)
         
         # Crear el Cloud Storage bucket
-        storage = CloudStorage(config)
-        print(f"🏭 GCP Factory: Creando Cloud Storage bucket {storage.name}")
+        storage = CloudStorage(config, name)
+        logger.debug("GCP Factory: Creando Cloud Storage bucket %s", storage.name)
         
         return storage
     
-    def get_provider_info(self) -> Dict[str, Any]:
-        """Retorna información sobre el proveedor GCP"""
-        return {
-            "name": "Google Cloud Platform",
-            "code": "gcp",
-            "supported_regions": self.supported_regions,
-            "services": {
-                "compute": "Compute Engine",
-                "database": "Cloud SQL",
-                "load_balancer": "Cloud Load Balancing",
-                "storage": "Cloud Storage"
-            }
-        }
+    def get_provider_info(self) -> Mapping[str, Any]:
+        """Retorna información sobre el proveedor GCP (vista de solo lectura)"""
+        return self._PROVIDER_INFO
     
     def get_provider_name(self) -> str:
         """Retorna el nombre del proveedor"""
@@ -122,78 +157,21 @@ class GCPCloudFactory(CloudAbstractFactory):
     
     def validate_region(self, region: str) -> bool:
         """Valida si la región es soportada por GCP"""
-        return region in self.supported_regions
-    
-    def _validate_vm_config(self, config: Dict[str, Any]) -> None:
-        """Valida la configuración específica de Compute Engine"""
-        required_fields = ["machine_type"]
-        for field in required_fields:
-            if field not in config:
-                raise ValueError(f"Campo requerido faltante para GCP VM: {field}")
-        
-        # Validar machine types válidos de GCP
-        valid_machine_types = [
-            "e2-micro", "e2-small", "e2-medium", "e2-standard-2", "e2-standard-4",
-            "n1-standard-1", "n1-standard-2", "n1-standard-4", "n1-standard-8",
-            "n2-standard-2", "n2-standard-4", "n2-standard-8"
-        ]
-        
-        if config["machine_type"] not in valid_machine_types:
-            raise ValueError(f"Machine type inválido para GCP: {config['machine_type']}")
+        return region in self._REGION_SET
     
-    def _validate_database_config(self, config: Dict[str, Any]) -> None:
-        """Valida la configuración específica de Cloud SQL"""
-        required_fields = ["engine"]
-        for field in required_fields:
-            if field not in config:
-                raise ValueError(f"Campo requerido faltante para GCP Database: {field}")
-        
-        # Validar engines soportados
-        valid_engines = ["mysql", "postgres", "sqlserver"]
-        if config["engine"] not in valid_engines:
-            raise ValueError(f"Engine de base de datos inválido para GCP: {config['engine']}")
-    
-    def _validate_load_balancer_config(self, config: Dict[str, Any]) -> None:
-        """Valida la configuración específica del Load Balancer de GCP"""
-        # Validar tipos de load balancer válidos
-        valid_types = ["HTTP(S)", "TCP", "UDP", "SSL"]
-        lb_type = config.get("type", "HTTP(S)")
-        
-        if lb_type not in valid_types:
-            raise ValueError(f"Tipo de load balancer inválido para GCP: {lb_type}")
-    
-    def _validate_storage_config(self, config: Dict[str, Any]) -> None:
-        """Valida la configuración específica de Cloud Storage"""
-        # Validar storage classes válidos
-        valid_storage_classes = ["STANDARD", "NEARLINE", "COLDLINE", "ARCHIVE"]
-        storage_class = config.get("storage_class", "STANDARD")
-        
-        if storage_class not in valid_storage_classes:
-            raise ValueError(f"Storage class inválido para GCP: {storage_class}")
-        
-        # Validar ubicaciones válidas
-        valid_locations = ["US", "EU", "ASIA"] + self.supported_regions
-        location = config.get("location", "US")
-        
-        if location not in valid_locations:
-            raise ValueError(f"Ubicación inválida para GCP Storage: {location}")
-
     # ---------------------- Métodos de capacidades (expuestos al endpoint info) ----------------------
-    def get_supported_machine_types(self) -> list[str]:
-        return [
-            "e2-micro", "e2-small", "e2-medium", "e2-standard-2", "e2-standard-4",
-            "n1-standard-1", "n1-standard-2", "n1-standard-4", "n1-standard-8",
-            "n2-standard-2", "n2-standard-4", "n2-standard-8"
-        ]
+    # Devuelven las tuplas de clase: inmutables, sin copia por llamada
+    def get_supported_machine_types(self) -> Tuple[str, ...]:
+        return self._MACHINE_TYPES
 
-    def get_supported_database_engines(self) -> list[str]:
-        return ["mysql", "postgres", "sqlserver"]
+    def get_supported_database_engines(self) -> Tuple[str, ...]:
+        return self._DATABASE_ENGINES
 
-    def get_supported_storage_classes(self) -> list[str]:
-        return ["STANDARD", "NEARLINE", "COLDLINE", "ARCHIVE"]
+    def get_supported_storage_classes(self) -> Tuple[str, ...]:
+        return self._STORAGE_CLASSES
 
-    def get_supported_load_balancer_types(self) -> list[str]:
-        return ["HTTP(S)", "TCP", "UDP", "SSL"]
+    def get_supported_load_balancer_types(self) -> Tuple[str, ...]:
+        return self._LOAD_BALANCER_TYPES
 
-    def get_supported_locations(self) -> list[str]:
-        return ["US", "EU", "ASIA"] + self.supported_regions
\ No newline at end of file
+    def get_supported_locations(self) -> Tuple[str, ...]:
+        return self._LOCATIONS
\ No newline at end of file
@@ -1,24 +1,96 @@
-from typing import Dict, Any
+import logging
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, FrozenSet, Mapping, Tuple
 from ..abstractions.factory import CloudAbstractFactory
 from ..abstractions.products import VirtualMachine, Database, LoadBalancer, Storage
 from ..products.onprem_products import OnPremiseVirtualMachine, OnPremiseDatabase, OnPremiseLoadBalancer, OnPremiseStorage
 
+# Trazas de diagnóstico: formateo diferido, sin escribir en stdout por petición
+logger = logging.getLogger(__name__)
+
+# Puerto estándar de cada engine de base de datos
+_DEFAULT_PORTS = MappingProxyType({
+    "postgresql": 5432,
+    "mysql": 3306,
+    "oracle": 1521,
+    "sqlserver": 1433
+})
+
 
 class OnPremiseCloudFactory(CloudAbstractFactory):
 
-    def __init__(self):
-        self.provider_name = "onprem"
-        self.supported_hypervisors = ["vmware", "hyperv", "kvm", "xen"]
-        self.supported_database_engines = ["postgresql", "mysql", "oracle", "sqlserver"]
-        self.supported_load_balancer_types = ["nginx", "haproxy", "f5", "citrix"]
-        self.supported_storage_types = ["nfs", "smb", "iscsi", "fc"]
-    
+    __slots__ = ()
+
+    provider_name = "onprem"
+
+    # Datos estáticos compartidos por todas las instancias: tuplas ordenadas para
+    # las respuestas y los mensajes, frozensets para las comprobaciones
+    supported_hypervisors: ClassVar[Tuple[str, ...]] = ("vmware", "hyperv", "kvm", "xen")
+    supported_database_engines: ClassVar[Tuple[str, ...]] = ("postgresql", "mysql", "oracle", "sqlserver")
+    supported_load_balancer_types: ClassVar[Tuple[str, ...]] = ("nginx", "haproxy", "f5", "citrix")
+    supported_storage_types: ClassVar[Tuple[str, ...]] = ("nfs", "smb", "iscsi", "fc")
+    _HYPERVISOR_SET: ClassVar[FrozenSet[str]] = frozenset(supported_hypervisors)
+    _DATABASE_ENGINE_SET: ClassVar[FrozenSet[str]] = frozenset(supported_database_engines)
+    _LOAD_BALANCER_TYPE_SET: ClassVar[FrozenSet[str]] = frozenset(supported_load_balancer_types)
+    _STORAGE_TYPE_SET: ClassVar[FrozenSet[str]] = frozenset(supported_storage_types)
+    _ALGORITHMS: ClassVar[Tuple[str, ...]] = ("round_robin", "least_conn", "ip_hash", "least_time")
+    _ALGORITHM_SET: ClassVar[FrozenSet[str]] = frozenset(_ALGORITHMS)
+    _PROVIDER_INFO: ClassVar[Mapping[str, Any]] = MappingProxyType({
+        "name": "On-Premise Infrastructure",
+        "code": "onprem",
+        "supported_hypervisors": supported_hypervisors,
+        "supported_database_engines": supported_database_engines,
+        "supported_load_balancer_types": supported_load_balancer_types,
+        "supported_storage_types": supported_storage_types,
+        "services": MappingProxyType({
+            "compute": "Virtual Machines (VMware/Hyper-V/KVM/Xen)",
+            "database": "Database Servers (PostgreSQL/MySQL/Oracle/SQL Server)",
+            "load_balancer": "Load Balancers (Nginx/HAProxy/F5/Citrix)",
+            "storage": "Network Storage (NFS/SMB/iSCSI/FC)"
+        })
+    })
+
+    MISSING_FIELDS_ERROR = "Campo requerido faltante para OnPrem {resource}: {field_names}"
+    REQUIRED_FIELDS = MappingProxyType({
+        "vm": frozenset({"cpu", "ram_gb", "disk_gb", "nic"}),
+        "database": frozenset({"engine"}),
+        "storage": frozenset({"storage_type"})
+    })
+    ALLOWED_VALUES = MappingProxyType({
+        "vm": (
+            ("hypervisor", "vmware", _HYPERVISOR_SET,
+             f"Hipervisor inválido para OnPrem: {{value}}. Soportados: {list(supported_hypervisors)}"),
+        ),
+        "database": (
+            ("engine", None, _DATABASE_ENGINE_SET,
+             f"Engine de base de datos inválido para OnPrem: {{value}}. Soportados: {list(supported_database_engines)}"),
+        ),
+        "load_balancer": (
+            ("type", "nginx", _LOAD_BALANCER_TYPE_SET,
+             f"Tipo de load balancer inválido para OnPrem: {{value}}. Soportados: {list(supported_load_balancer_types)}"),
+            ("algorithm", "round_robin", _ALGORITHM_SET,
+             f"Algoritmo de balanceo inválido: {{value}}. Válidos: {list(_ALGORITHMS)}"),
+        ),
+        "storage": (
+            ("storage_type", None, _STORAGE_TYPE_SET,
+             f"Tipo de storage inválido para OnPrem: {{value}}. Soportados: {list(supported_storage_types)}"),
+        )
+    })
+    MINIMUM_VALUES = MappingProxyType({
+        "vm": (
+            ("cpu", None, 1, "CPU mínimo: 1 core"),
+            ("ram_gb", None, 1, "RAM mínima: 1GB"),
+            ("disk_gb", None, 10, "Disco mínimo: 10GB")
+        ),
+        "storage": (("capacity_gb", 100, 10, "Capacidad mínima de storage: 10GB"),)
+    })
+
     def create_virtual_machine(self, name: str, vm_config: Dict[str, Any]) -> VirtualMachine:
         config = vm_config.copy()
         config["name"] = name
-        self._validate_vm_config(config)
+        self._validate_resource("vm", config)
         vm = OnPremiseVirtualMachine(config)
-        print(f"🏭 OnPrem Factory: Creando VM {vm.name} en {vm.hypervisor}")
+        logger.debug("OnPrem Factory: Creando VM %s en %s", vm.name, vm.hypervisor)
         return vm
 
     def create_database(self, name: str, db_config: Dict[str, Any]) -> Database:
@@ -26,41 +98,28 @@ class OnPremiseCloudFactory(CloudAbstractFactory):
         config["name"] = name
         self._validate_database_config(config)
         database = OnPremiseDatabase(config)
-        print(f"🏭 OnPrem Factory: Creando base de datos {database.name} ({database.engine})")
+        logger.debug("OnPrem Factory: Creando base de datos %s (%s)", database.name, database.engine)
         return database
 
     def create_load_balancer(self, name: str, lb_config: Dict[str, Any]) -> LoadBalancer:
         config = lb_config.copy()
         config["name"] = name
-        self._validate_load_balancer_config(config)
+        self._validate_resource("load_balancer", config)
         load_balancer = OnPremiseLoadBalancer(config)
-        print(f"🏭 OnPrem Factory: Creando Load Balancer {load_balancer.name} ({load_balancer.load_balancer_type})")
+        logger.debug("OnPrem Factory: Creando Load Balancer %s (%s)", load_balancer.name, load_balancer.load_balancer_type)
         return load_balancer
 
     def create_storage(self, name: str, storage_config: Dict[str, Any]) -> Storage:
         config = storage_config.copy()
         config["name"] = name
-        self._validate_storage_config(config)
+        self._validate_resource("storage", config)
         storage = OnPremiseStorage(config)
-        print(f"🏭 OnPrem Factory: Creando storage {storage.name} ({storage.storage_type})")
+        logger.debug("OnPrem Factory: Creando storage %s (%s)", storage.name, storage.storage_type)
         return storage
     
-    def get_provider_info(self) -> Dict[str, Any]:
-        """Retorna información sobre el proveedor on-premise"""
-        return {
-            "name": "On-Premise Infrastructure",
-            "code": "onprem",
-            "supported_hypervisors": self.supported_hypervisors,
-            "supported_database_engines": self.supported_database_engines,
-            "supported_load_balancer_types": self.supported_load_balancer_types,
-            "supported_storage_types": self.supported_storage_types,
-            "services": {
-                "compute": "Virtual Machines (VMware/Hyper-V/KVM/Xen)",
-                "database": "Database Servers (PostgreSQL/MySQL/Oracle/SQL Server)",
-                "load_balancer": "Load Balancers (Nginx/HAProxy/F5/Citrix)",
-                "storage": "Network Storage (NFS/SMB/iSCSI/FC)"
-            }
-        }
+    def get_provider_info(self) -> Mapping[str, Any]:
+        """Retorna información sobre el proveedor on-premise (vista de solo lectura)"""
+        return self._PROVIDER_INFO
     
     def get_provider_name(self) -> str:
         """Retorna el nombre del proveedor"""
@@ -70,76 +129,13 @@ class OnPremiseCloudFactory(CloudAbstractFactory):
         """Para on-premise, todas las 'regiones' (ubicaciones) son válidas"""
         return True
     
-    def _validate_vm_config(self, config: Dict[str, Any]) -> None:
-        """Valida la configuración específica de VM on-premise"""
-        required_fields = ["cpu", "ram_gb", "disk_gb", "nic"]
-        for field in required_fields:
-            if field not in config:
-                raise ValueError(f"Campo requerido faltante para OnPrem VM: {field}")
-        
-        # Validar hipervisor válido
-        hypervisor = config.get("hypervisor", "vmware")
-        if hypervisor not in self.supported_hypervisors:
-            raise ValueError(f"Hipervisor inválido para OnPrem: {hypervisor}. Soportados: {self.supported_hypervisors}")
-        
-        # Validar recursos mínimos
-        if config["cpu"] < 1:
-            raise ValueError("CPU mínimo: 1 core")
-        if config["ram_gb"] < 1:
-            raise ValueError("RAM mínima: 1GB")
-        if config["disk_gb"] < 10:
-            raise ValueError("Disco mínimo: 10GB")
-    
     def _validate_database_config(self, config: Dict[str, Any]) -> None:
         """Valida la configuración específica de base de datos on-premise"""
-        required_fields = ["engine"]
-        for field in required_fields:
-            if field not in config:
-                raise ValueError(f"Campo requerido faltante para OnPrem Database: {field}")
-        
-        # Validar engine soportado
-        if config["engine"] not in self.supported_database_engines:
-            raise ValueError(f"Engine de base de datos inválido para OnPrem: {config['engine']}. Soportados: {self.supported_database_engines}")
+        self._validate_resource("database", config)
         
         # Validar puerto según engine
-        default_ports = {
-            "postgresql": 5432,
-            "mysql": 3306,
-            "oracle": 1521,
-            "sqlserver": 1433
-        }
-        
-        expected_port = default_ports.get(config["engine"])
+        expected_port = _DEFAULT_PORTS.get(config["engine"])
         actual_port = config.get("port", expected_port)
         
         if actual_port != expected_port:
-            print(f"⚠️ Advertencia: Puerto {actual_port} no es el estándar para {config['engine']} ({expected_port})")
-    
-    def _validate_load_balancer_config(self, config: Dict[str, Any]) -> None:
-        """Valida la configuración específica del Load Balancer on-premise"""
-        # Validar tipo de load balancer
-        lb_type = config.get("type", "nginx")
-        if lb_type not in self.supported_load_balancer_types:
-            raise ValueError(f"Tipo de load balancer inválido para OnPrem: {lb_type}. Soportados: {self.supported_load_balancer_types}")
-        
-        # Validar algoritmo de balanceo
-        valid_algorithms = ["round_robin", "least_conn", "ip_hash", "least_time"]
-        algorithm = config.get("algorithm", "round_robin")
-        if algorithm not in valid_algorithms:
-            raise ValueError(f"Algoritmo de balanceo inválido: {algorithm}. Válidos: {valid_algorithms}")
-    
-    def _validate_storage_config(self, config: Dict[str, Any]) -> None:
-        """Valida la configuración específica de almacenamiento on-premise"""
-        required_fields = ["storage_type"]
-        for field in required_fields:
-            if field not in config:
-                raise ValueError(f"Campo requerido faltante para OnPrem Storage: {field}")
-        
-        # Validar tipo de almacenamiento soportado
-        if config["storage_type"] not in self.supported_storage_types:
-            raise ValueError(f"Tipo de storage inválido para OnPrem: {config['storage_type']}. Soportados: {self.supported_storage_types}")
-        
-        # Validar capacidad mínima
-        capacity = config.get("capacity_gb", 100)
-        if capacity < 10:
-            raise ValueError("Capacidad mínima de storage: 10GB")
\ No newline at end of file
+            logger.warning("Puerto %s no es el estándar para %s (%s)", actual_port, config["engine"], expected_port)
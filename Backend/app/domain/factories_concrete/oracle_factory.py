@@ -1,9 +1,13 @@
-
-from typing import Dict, Any
+import logging
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, FrozenSet, Mapping, Tuple
 from ..abstractions.factory import CloudAbstractFactory
 from ..abstractions.products import VirtualMachine, Database, LoadBalancer, Storage
 from ..products.oracle_products import OracleComputeInstance, OracleAutonomousDatabase, OracleLoadBalancer, OracleObjectStorage
 
+# Trazas de diagnóstico: formateo diferido, sin escribir en stdout por petición
+logger = logging.getLogger(__name__)
+
 
 class OracleCloudFactory(CloudAbstractFactory):
     """
@@ -11,15 +15,60 @@ class OracleCloudFactory(CloudAbstractFactory):
     Implementa el Abstract Factory pattern para Oracle Cloud.
     """
     
-    def __init__(self):
-        self.provider_name = "oracle"
-        self.supported_regions = [
-            "us-ashburn-1", "us-phoenix-1", "us-sanjose-1",
-            "ca-toronto-1", "ca-montreal-1",
-            "eu-frankfurt-1", "eu-zurich-1", "eu-amsterdam-1",
-            "uk-london-1", "ap-tokyo-1", "ap-osaka-1",
-            "ap-sydney-1", "ap-melbourne-1", "ap-mumbai-1"
-        ]
+    __slots__ = ()
+    
+    # Métodos opcionales de capacidades expuestos en /providers/{provider}/info
+    CAPABILITIES = frozenset({"compute_shapes", "database_workloads", "load_balancer_shapes", "storage_tiers"})
+    
+    provider_name = "oracle"
+    
+    # Datos estáticos compartidos por todas las instancias: tuplas ordenadas para
+    # las respuestas y frozensets para las comprobaciones de pertenencia
+    _SUPPORTED_REGIONS: ClassVar[Tuple[str, ...]] = (
+        "us-ashburn-1", "us-phoenix-1", "us-sanjose-1",
+        "ca-toronto-1", "ca-montreal-1",
+        "eu-frankfurt-1", "eu-zurich-1", "eu-amsterdam-1",
+        "uk-london-1", "ap-tokyo-1", "ap-osaka-1",
+        "ap-sydney-1", "ap-melbourne-1", "ap-mumbai-1"
+    )
+    _REGION_SET: ClassVar[FrozenSet[str]] = frozenset(_SUPPORTED_REGIONS)
+    _COMPUTE_SHAPES: ClassVar[Tuple[str, ...]] = (
+        "VM.Standard2.1", "VM.Standard2.2", "VM.Standard2.4", "VM.Standard2.8",
+        "VM.Standard3.Flex", "VM.Optimized3.Flex", "BM.Standard2.52",
+        "BM.Standard3.64", "VM.Standard.E3.Flex", "VM.Standard.E4.Flex"
+    )
+    _COMPUTE_SHAPE_SET: ClassVar[FrozenSet[str]] = frozenset(_COMPUTE_SHAPES)
+    _DATABASE_WORKLOADS: ClassVar[Tuple[str, ...]] = ("OLTP", "DW", "AJD", "APEX")
+    _DATABASE_WORKLOAD_SET: ClassVar[FrozenSet[str]] = frozenset(_DATABASE_WORKLOADS)
+    _LOAD_BALANCER_SHAPES: ClassVar[Tuple[str, ...]] = ("10Mbps", "100Mbps", "400Mbps", "8000Mbps")
+    _LOAD_BALANCER_SHAPE_SET: ClassVar[FrozenSet[str]] = frozenset(_LOAD_BALANCER_SHAPES)
+    _STORAGE_TIERS: ClassVar[Tuple[str, ...]] = ("Standard", "InfrequentAccess", "Archive")
+    _STORAGE_TIER_SET: ClassVar[FrozenSet[str]] = frozenset(_STORAGE_TIERS)
+    _PROVIDER_INFO: ClassVar[Mapping[str, Any]] = MappingProxyType({
+        "name": "Oracle Cloud Infrastructure",
+        "code": "oracle",
+        "supported_regions": _SUPPORTED_REGIONS,
+        "services": MappingProxyType({
+            "compute": "Oracle Compute",
+            "database": "Autonomous Database",
+            "load_balancer": "Oracle Load Balancer",
+            "storage": "Object Storage"
+        })
+    })
+    
+    MISSING_FIELDS_ERROR = "Campo requerido faltante para Oracle {resource}: {field_names}"
+    REQUIRED_FIELDS = MappingProxyType({
+        "vm": frozenset({"compute_shape", "compartment_id", "availability_domain", "subnet_id", "image_id"}),
+        "database": frozenset({"workload_type", "compartment_id"}),
+        "load_balancer": frozenset({"compartment_id"}),
+        "storage": frozenset({"namespace", "compartment_id"})
+    })
+    ALLOWED_VALUES = MappingProxyType({
+        "vm": (("compute_shape", None, _COMPUTE_SHAPE_SET, "Compute shape inválido para Oracle: {value}"),),
+        "database": (("workload_type", None, _DATABASE_WORKLOAD_SET, "Workload type inválido para Oracle Database: {value}"),),
+        "load_balancer": (("shape", "100Mbps", _LOAD_BALANCER_SHAPE_SET, "Shape de load balancer inválido para Oracle: {value}"),),
+        "storage": (("storage_tier", "Standard", _STORAGE_TIER_SET, "Storage tier inválido para Oracle: {value}"),)
+    })
     
     def create_virtual_machine(self, name: str, vm_config: Dict[str, Any]) -> VirtualMachine:
         """
@@ -32,13 +81,11 @@ class OracleCloudFactory(CloudAbstractFactory):
             OracleComputeInstance: Nueva instancia de VM de Oracle Cloud
         """
         # Validar configuración específica de Oracle
-        config = vm_config.copy()
-        config["name"] = name
-        self._validate_vm_config(config)
+        self._validate_resource("vm", vm_config)
         
         # Crear la instancia de Oracle Compute
-        vm = OracleComputeInstance(config)
-        print(f"🏭 Oracle Factory: Creando Compute instance {vm.name}")
+        vm = OracleComputeInstance(vm_config, name)
+        logger.debug("Oracle Factory: Creando Compute instance %s", vm.name)
         
         return vm
     
@@ -53,13 +100,11 @@ class OracleCloudFactory(CloudAbstractFactory):
             OracleAutonomousDatabase: Nueva instancia de base de datos de Oracle Cloud
         """
         # Validar configuración específica de Oracle
-        config = db_config.copy()
-        config["name"] = name
-        self._validate_database_config(config)
+        self._validate_resource("database", db_config)
         
         # Crear la Autonomous Database
-        database = OracleAutonomousDatabase(config)
-        print(f"🏭 Oracle Factory: Creando Autonomous Database {database.name}")
+        database = OracleAutonomousDatabase(db_config, name)
+        logger.debug("Oracle Factory: Creando Autonomous Database %s", database.name)
         
         return database
     
@@ -74,13 +119,11 @@ class OracleCloudFactory(CloudAbstractFactory):
             OracleLoadBalancer: Nueva instancia de load balancer de Oracle Cloud
         """
         # Validar configuración específica de Oracle
-        config = lb_config.copy()
-        config["name"] = name
-        self._validate_load_balancer_config(config)
+        self._validate_resource("load_balancer", lb_config)
         
         # Crear el Load Balancer
-        load_balancer = OracleLoadBalancer(config)
-        print(f"🏭 Oracle Factory: Creando Load Balancer {load_balancer.name}")
+        load_balancer = OracleLoadBalancer(lb_config, name)
+        logger.debug("Oracle Factory: Creando Load Balancer %s", load_balancer.name)
         
         return load_balancer
     
@@ -95,29 +138,17 @@ class OracleCloudFactory(CloudAbstractFactory):
             OracleObjectStorage: Nueva instancia de storage de Oracle Cloud
         """
         # Validar configuración específica de Oracle
-        config = storage_config.copy()
-        config["name"] = name
-        self._validate_storage_config(config)
+        self._validate_resource("storage", storage_config)
         
         # Crear el Object Storage bucket
-        storage = OracleObjectStorage(config)
-        print(f"🏭 Oracle Factory: Creando Object Storage bucket {storage.name}")
+        storage = OracleObjectStorage(storage_config, name)
+        logger.debug("Oracle Factory: Creando Object Storage bucket %s", storage.name)
         
         return storage
     
-    def get_provider_info(self) -> Dict[str, Any]:
-        """Retorna información sobre el proveedor Oracle Cloud"""
-        return {
-            "name": "Oracle Cloud Infrastructure",
-            "code": "oracle",
-            "supported_regions": self.supported_regions,
-            "services": {
-                "compute": "Oracle Compute",
-                "database": "Autonomous Database",
-                "load_balancer": "Oracle Load Balancer",
-                "storage": "Object Storage"
-            }
-        }
+    def get_provider_info(self) -> Mapping[str, Any]:
+        """Retorna información sobre el proveedor Oracle Cloud (vista de solo lectura)"""
+        return self._PROVIDER_INFO
     
     def get_provider_name(self) -> str:
         """Retorna el nombre del proveedor"""
@@ -125,79 +156,18 @@ class OracleCloudFactory(CloudAbstractFactory):
     
     def validate_region(self, region: str) -> bool:
         """Valida si la región es soportada por Oracle"""
-        return region in self.supported_regions
-    
-    def _validate_vm_config(self, config: Dict[str, Any]) -> None:
-        """Valida la configuración específica de Oracle Compute"""
-        required_fields = ["compute_shape", "compartment_id", "availability_domain", "subnet_id", "image_id"]
-        for field in required_fields:
-            if field not in config:
-                raise ValueError(f"Campo requerido faltante para Oracle VM: {field}")
-        
-        # Validar compute shapes válidos de Oracle
-        valid_compute_shapes = [
-            "VM.Standard2.1", "VM.Standard2.2", "VM.Standard2.4", "VM.Standard2.8",
-            "VM.Standard3.Flex", "VM.Optimized3.Flex",
-            "BM.Standard2.52", "BM.Standard3.64",
-            "VM.Standard.E3.Flex", "VM.Standard.E4.Flex"
-        ]
-        
-        if config["compute_shape"] not in valid_compute_shapes:
-            raise ValueError(f"Compute shape inválido para Oracle: {config['compute_shape']}")
+        return region in self._REGION_SET
     
-    def _validate_database_config(self, config: Dict[str, Any]) -> None:
-        """Valida la configuración específica de Autonomous Database"""
-        required_fields = ["workload_type", "compartment_id"]
-        for field in required_fields:
-            if field not in config:
-                raise ValueError(f"Campo requerido faltante para Oracle Database: {field}")
-        
-        # Validar workload types soportados
-        valid_workload_types = ["OLTP", "DW", "AJD", "APEX"]
-        if config["workload_type"] not in valid_workload_types:
-            raise ValueError(f"Workload type inválido para Oracle Database: {config['workload_type']}")
-    
-    def _validate_load_balancer_config(self, config: Dict[str, Any]) -> None:
-        """Valida la configuración específica del Load Balancer de Oracle"""
-        required_fields = ["compartment_id"]
-        for field in required_fields:
-            if field not in config:
-                raise ValueError(f"Campo requerido faltante para Oracle Load Balancer: {field}")
-        
-        # Validar shapes válidos de Load Balancer
-        valid_shapes = ["10Mbps", "100Mbps", "400Mbps", "8000Mbps"]
-        shape = config.get("shape", "100Mbps")
-        
-        if shape not in valid_shapes:
-            raise ValueError(f"Shape de load balancer inválido para Oracle: {shape}")
-    
-    def _validate_storage_config(self, config: Dict[str, Any]) -> None:
-        """Valida la configuración específica de Object Storage"""
-        required_fields = ["namespace", "compartment_id"]
-        for field in required_fields:
-            if field not in config:
-                raise ValueError(f"Campo requerido faltante para Oracle Storage: {field}")
-        
-        # Validar storage tiers válidos
-        valid_storage_tiers = ["Standard", "InfrequentAccess", "Archive"]
-        storage_tier = config.get("storage_tier", "Standard")
-        
-        if storage_tier not in valid_storage_tiers:
-            raise ValueError(f"Storage tier inválido para Oracle: {storage_tier}")
-
     # ---------------------- Métodos de capacidades (expuestos al endpoint info) ----------------------
-    def get_supported_compute_shapes(self) -> list[str]:
-        return [
-            "VM.Standard2.1", "VM.Standard2.2", "VM.Standard2.4", "VM.Standard2.8",
-            "VM.Standard3.Flex", "VM.Optimized3.Flex", "BM.Standard2.52",
-            "BM.Standard3.64", "VM.Standard.E3.Flex", "VM.Standard.E4.Flex"
-        ]
+    # Devuelven las tuplas de clase: inmutables, sin copia por llamada
+    def get_supported_compute_shapes(self) -> Tuple[str, ...]:
+        return self._COMPUTE_SHAPES
 
-    def get_supported_database_workloads(self) -> list[str]:
-        return ["OLTP", "DW", "AJD", "APEX"]
+    def get_supported_database_workloads(self) -> Tuple[str, ...]:
+        return self._DATABASE_WORKLOADS
 
-    def get_supported_load_balancer_shapes(self) -> list[str]:
-        return ["10Mbps", "100Mbps", "400Mbps", "8000Mbps"]
+    def get_supported_load_balancer_shapes(self) -> Tuple[str, ...]:
+        return self._LOAD_BALANCER_SHAPES
 
-    def get_supported_storage_tiers(self) -> list[str]:
-        return ["Standard", "InfrequentAccess", "Archive"]
\ No newline at end of file
+    def get_supported_storage_tiers(self) -> Tuple[str, ...]:
+        return self._STORAGE_TIERS
\ No newline at end of file
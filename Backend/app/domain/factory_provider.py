@@ -9,7 +9,9 @@ Este módulo implementa todos los principios SOLID:
 - ISP: Interfaces segregadas por tipo de recurso
 - DIP: Depende de abstracciones, no de implementaciones concretas
 """
-from typing import Dict, Type
+import logging
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple, Type, Union
 from enum import Enum
 from .abstractions.factory import CloudAbstractFactory
 from .factories_concrete.aws_factory import AWSCloudFactory
@@ -18,6 +20,8 @@ from .factories_concrete.gcp_factory import GCPCloudFactory
 from .factories_concrete.oracle_factory import OracleCloudFactory
 from .factories_concrete.onprem_factory import OnPremiseCloudFactory
 
+logger = logging.getLogger(__name__)
+
 
 class CloudProvider(str, Enum):
     """Enumeración de proveedores de cloud soportados"""
@@ -37,6 +41,11 @@ class FactoryProvider:
     def __init__(self):
         # Registro de factories disponibles (patrón Registry)
         self._factories: Dict[CloudProvider, Type[CloudAbstractFactory]] = {}
+        # Instancia compartida por proveedor: las factories no guardan estado
+        # mutable, así que se crean una vez al registrarlas y se reutilizan
+        self._instances: Dict[CloudProvider, CloudAbstractFactory] = {}
+        # Códigos registrados, recalculados solo al registrar una factory
+        self._provider_codes: Tuple[str, ...] = ()
         self._register_default_factories()
     
     def _register_default_factories(self) -> None:
@@ -54,40 +63,48 @@ class FactoryProvider:
     ) -> None:
         """Registra una nueva factory para un proveedor (OCP - Open/Closed Principle)"""
         self._factories[provider] = factory_class
-        print(f"✅ Abstract Factory registrada para proveedor: {provider.value}")
+        self._instances[provider] = factory_class()
+        self._provider_codes = tuple(p.value for p in self._factories)
+        logger.debug("Abstract Factory registrada para proveedor: %s", provider.value)
     
     def get_factory(self, provider: CloudProvider) -> CloudAbstractFactory:
         """
         Factory Method principal: retorna la Abstract Factory apropiada.
         REEMPLAZA completamente el patrón Factory Method anterior.
         """
-        if provider not in self._factories:
-            available_providers = list(self._factories.keys())
+        try:
+            return self._instances[provider]
+        except KeyError:
             raise ValueError(
                 f"Proveedor '{provider}' no soportado. "
-                f"Proveedores disponibles: {[p.value for p in available_providers]}"
-            )
-        
-        factory_class = self._factories[provider]
-        factory_instance = factory_class()
-        
-        print(f"🏭 Abstract Factory Provider: Creando factory para {provider.value}")
-        return factory_instance
+                f"Proveedores disponibles: {list(self._provider_codes)}"
+            ) from None
     
     def get_available_providers(self) -> list[str]:
         """Retorna la lista de proveedores disponibles"""
-        return [provider.value for provider in self._factories.keys()]
+        return list(self._provider_codes)
+
+    def get_available_provider_codes(self) -> Tuple[str, ...]:
+        """Códigos de los proveedores registrados (tupla compartida, sin copia)"""
+        return self._provider_codes
     
-    def is_provider_supported(self, provider: CloudProvider) -> bool:
-        """Verifica si un proveedor está soportado"""
+    def is_provider_supported(self, provider: Union[str, CloudProvider]) -> bool:
+        """
+        Verifica si un proveedor está soportado. Acepta a propósito códigos en
+        bruto ("aws"): CloudProvider es un str Enum, así que el código y su miembro
+        tienen el mismo hash y son iguales como claves del registro.
+        """
         return provider in self._factories
     
-    def get_provider_capabilities(self, provider: CloudProvider) -> Dict[str, any]:
-        """Obtiene las capacidades de un proveedor específico"""
-        if not self.is_provider_supported(provider):
+    def get_provider_capabilities(self, provider: CloudProvider) -> Mapping[str, Any]:
+        """
+        Obtiene las capacidades de un proveedor específico. La instancia ya está
+        cacheada y get_provider_info devuelve una vista compartida: una sola
+        consulta al registro, sin copias.
+        """
+        factory = self._instances.get(provider)
+        if factory is None:
             raise ValueError(f"Proveedor {provider} no soportado")
-            
-        factory = self.get_factory(provider)
         return factory.get_provider_info()
 
 
@@ -103,12 +120,30 @@ def create_cloud_factory(provider: CloudProvider) -> CloudAbstractFactory:
     return _factory_provider.get_factory(provider)
 
 
+# Códigos del API de VMs (ProviderEnum) que no coinciden con CloudProvider
+_PROVIDER_ALIASES = MappingProxyType({"onpremise": CloudProvider.ONPREM})
+
+
+def get_cloud_factory(provider: str) -> CloudAbstractFactory:
+    """
+    Devuelve la factory compartida para un código de proveedor, ya sea un
+    CloudProvider o un código del API de VMs. No construye el enum en cada llamada:
+    CloudProvider es un str Enum y el registro se consulta con el propio código.
+    """
+    return _factory_provider.get_factory(_PROVIDER_ALIASES.get(provider, provider))
+
+
 def get_available_providers() -> list[str]:
     """Función de conveniencia para obtener proveedores disponibles"""
     return _factory_provider.get_available_providers()
 
 
-def get_provider_capabilities(provider: CloudProvider) -> Dict[str, any]:
+def get_available_provider_codes() -> Tuple[str, ...]:
+    """Igual que get_available_providers pero sin copiar la tupla interna"""
+    return _factory_provider.get_available_provider_codes()
+
+
+def get_provider_capabilities(provider: CloudProvider) -> Mapping[str, Any]:
     """Obtiene información detallada sobre las capacidades de un proveedor"""
     return _factory_provider.get_provider_capabilities(provider)
 
@@ -122,9 +157,9 @@ def register_custom_factory(
 
 
 def is_provider_supported(provider_str: str) -> bool:
-    """Verifica si un proveedor (como string) está soportado"""
-    try:
-        provider = CloudProvider(provider_str)
-        return _factory_provider.is_provider_supported(provider)
-    except ValueError:
-        return False
\ No newline at end of file
+    """
+    Verifica si un proveedor (como string) está soportado. Igual que en
+    get_cloud_factory, el código se busca directamente en el registro: un código
+    desconocido es un fallo de hash, sin construir el enum ni lanzar ValueError.
+    """
+    return _factory_provider.is_provider_supported(provider_str)
\ No newline at end of file
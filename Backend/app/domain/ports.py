@@ -1,9 +1,13 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional, Tuple
 from app.domain.schemas import VMDTO
 
 
+class VMNotFoundError(KeyError):
+    """La VM no existe en el repositorio (subclase de KeyError por compatibilidad)"""
+
+
 class VMRepositoryPort(ABC):
     @abstractmethod
     def save(self, vm: VMDTO) -> None: ...
@@ -16,3 +20,21 @@ class VMRepositoryPort(ABC):
 
     @abstractmethod
     def list(self) -> List[VMDTO]: ...
+
+    @abstractmethod
+    def list_page(
+        self, offset: int, limit: int, provider: Optional[str] = None, status: Optional[str] = None
+    ) -> Tuple[List[VMDTO], int]:
+        """Devuelve (página de VMs, total), opcionalmente filtrada por proveedor y estado"""
+        ...
+
+    @abstractmethod
+    def version(self, vm_id: str) -> int:
+        """Revisión del último guardado de la VM (cambia con cada modificación)"""
+        ...
+
+    @property
+    @abstractmethod
+    def revision(self) -> int:
+        """Contador global que avanza con cada alta, modificación o borrado"""
+        ...
@@ -3,16 +3,26 @@ Productos concretos de AWS para el patrón Abstract Factory.
 Estos implementan las interfaces abstractas para los servicios específicos de AWS.
 """
 from __future__ import annotations
+import logging
 from typing import Dict, Any, List
-import uuid
+from secrets import token_bytes, token_hex
+from types import MappingProxyType
 from ..abstractions.products import VirtualMachine, Database, LoadBalancer, Storage, ResourceStatus, NetworkInterface
 
+# Trazas de diagnóstico: formateo diferido, sin escribir en stdout por petición
+logger = logging.getLogger(__name__)
+
 
 class EC2Instance(VirtualMachine):
     """Implementación concreta de VM para AWS (EC2)"""
     
+    __slots__ = (
+        "instance_type", "ami", "vpc_id", "security_groups", "key_pair", "private_ip",
+        "public_ip"
+    )
+    
     def __init__(self, name: str, region: str, instance_type: str, ami: str, vpc_id: str):
-        super().__init__(f"i-{uuid.uuid4().hex[:8]}", name, region)
+        super().__init__(f"i-{token_hex(4)}", name, region)
         self.instance_type = instance_type
         self.ami = ami
         self.vpc_id = vpc_id
@@ -39,7 +49,7 @@ class EC2Instance(VirtualMachine):
         """Inicia la instancia EC2"""
         if self.status == ResourceStatus.STOPPED:
             self.status = ResourceStatus.RUNNING
-            print(f"✅ EC2 Instance {self.name} started in region {self.region}")
+            logger.debug("EC2 Instance %s started in region %s", self.name, self.region)
         else:
             raise ValueError(f"Cannot start instance in state {self.status}")
     
@@ -47,14 +57,14 @@ class EC2Instance(VirtualMachine):
         """Detiene la instancia EC2"""
         if self.status == ResourceStatus.RUNNING:
             self.status = ResourceStatus.STOPPED
-            print(f"⏹️ EC2 Instance {self.name} stopped")
+            logger.debug("EC2 Instance %s stopped", self.name)
         else:
             raise ValueError(f"Cannot stop instance in state {self.status}")
     
     def restart(self) -> None:
         """Reinicia la instancia EC2"""
         if self.status == ResourceStatus.RUNNING:
-            print(f"🔄 EC2 Instance {self.name} restarting...")
+            logger.debug("EC2 Instance %s restarting...", self.name)
             # Simula reinicio
             self.status = ResourceStatus.RUNNING
         else:
@@ -64,14 +74,16 @@ class EC2Instance(VirtualMachine):
         """Cambia el tipo de instancia"""
         old_type = self.instance_type
         self.instance_type = new_instance_type
-        print(f"📏 EC2 Instance {self.name} resized from {old_type} to {new_instance_type}")
+        logger.debug("EC2 Instance %s resized from %s to %s", self.name, old_type, new_instance_type)
 
 
 class RDSDatabase(Database):
     """Implementación concreta de Database para AWS (RDS)"""
     
+    __slots__ = ("engine", "instance_class", "allocated_storage", "endpoint", "port")
+    
     def __init__(self, name: str, region: str, engine: str, instance_class: str, allocated_storage: int):
-        super().__init__(f"db-{uuid.uuid4().hex[:8]}", name, region)
+        super().__init__(f"db-{token_hex(4)}", name, region)
         self.engine = engine
         self.instance_class = instance_class
         self.allocated_storage = allocated_storage
@@ -93,29 +105,32 @@ class RDSDatabase(Database):
     
     def backup(self) -> str:
         """Crea un snapshot de RDS"""
-        backup_id = f"snap-{uuid.uuid4().hex[:8]}"
-        print(f"📋 RDS Database {self.name} backup created: {backup_id}")
+        backup_id = f"snap-{token_hex(4)}"
+        logger.debug("RDS Database %s backup created: %s", self.name, backup_id)
         return backup_id
     
     def restore(self, backup_id: str) -> None:
         """Restaura desde un snapshot"""
-        print(f"🔄 RDS Database {self.name} restored from backup: {backup_id}")
+        logger.debug("RDS Database %s restored from backup: %s", self.name, backup_id)
     
     def scale(self, new_instance_class: str) -> None:
         """Escala la instancia RDS"""
         old_class = self.instance_class
         self.instance_class = new_instance_class
-        print(f"📈 RDS Database {self.name} scaled from {old_class} to {new_instance_class}")
+        logger.debug("RDS Database %s scaled from %s to %s", self.name, old_class, new_instance_class)
 
 
 class ApplicationLoadBalancer(LoadBalancer):
     """Implementación concreta de Load Balancer para AWS (ALB)"""
     
+    __slots__ = ("vpc_id", "scheme", "targets", "listeners", "dns_name")
+    
     def __init__(self, name: str, region: str, vpc_id: str, scheme: str = "internet-facing"):
-        super().__init__(f"alb-{uuid.uuid4().hex[:8]}", name, region)
+        super().__init__(f"alb-{token_hex(4)}", name, region)
         self.vpc_id = vpc_id
         self.scheme = scheme
-        self.targets: List[str] = []
+        # Dict como conjunto ordenado: alta/baja O(1) conservando el orden de registro
+        self.targets: Dict[str, None] = {}
         self.listeners: List[Dict[str, Any]] = []
         self.dns_name = f"{name}-{self.resource_id[-8:]}.{region}.elb.amazonaws.com"
     
@@ -127,7 +142,7 @@ class ApplicationLoadBalancer(LoadBalancer):
             "vpc_id": self.vpc_id,
             "scheme": self.scheme,
             "dns_name": self.dns_name,
-            "targets": self.targets,
+            "targets": list(self.targets),
             "listeners": self.listeners,
             "region": self.region
         }
@@ -135,14 +150,14 @@ class ApplicationLoadBalancer(LoadBalancer):
     def add_target(self, target_id: str) -> None:
         """Añade un target al ALB"""
         if target_id not in self.targets:
-            self.targets.append(target_id)
-            print(f"🎯 Target {target_id} added to ALB {self.name}")
+            self.targets[target_id] = None
+            logger.debug("Target %s added to ALB %s", target_id, self.name)
     
     def remove_target(self, target_id: str) -> None:
         """Remueve un target del ALB"""
         if target_id in self.targets:
-            self.targets.remove(target_id)
-            print(f"❌ Target {target_id} removed from ALB {self.name}")
+            del self.targets[target_id]
+            logger.debug("Target %s removed from ALB %s", target_id, self.name)
     
     def configure_health_check(self, config: Dict[str, Any]) -> None:
         """Configura health checks"""
@@ -152,14 +167,22 @@ class ApplicationLoadBalancer(LoadBalancer):
             "timeout": config.get("timeout", 5),
             "healthy_threshold": config.get("healthy_threshold", 2)
         }
-        print(f"❤️ Health check configured for ALB {self.name}: {health_check}")
+        logger.debug("Health check configured for ALB %s: %s", self.name, health_check)
 
 
 class S3Storage(Storage):
     """Implementación concreta de Storage para AWS (S3)"""
     
+    __slots__ = ("bucket_name", "storage_class", "objects", "versioning_enabled")
+    
+    # Metadatos simulados comunes a todos los objetos: se copian en cada subida
+    _OBJECT_METADATA = MappingProxyType({
+        "size": 1024,  # Simulado
+        "last_modified": "2024-01-01T00:00:00Z",
+    })
+    
     def __init__(self, name: str, region: str, storage_class: str = "STANDARD"):
-        super().__init__(f"s3-{uuid.uuid4().hex[:8]}", name, region)
+        super().__init__(f"s3-{token_hex(4)}", name, region)
         self.bucket_name = name
         self.storage_class = storage_class
         self.objects: Dict[str, Dict[str, Any]] = {}
@@ -179,21 +202,19 @@ class S3Storage(Storage):
     
     def create_bucket(self, bucket_name: str) -> None:
         """Crea un bucket S3 (ya creado en el constructor)"""
-        print(f"🪣 S3 Bucket {bucket_name} created in region {self.region}")
+        logger.debug("S3 Bucket %s created in region %s", bucket_name, self.region)
     
     def upload_file(self, file_path: str, key: str) -> None:
         """Simula la subida de un archivo a S3"""
-        self.objects[key] = {
-            "size": 1024,  # Simulado
-            "last_modified": "2024-01-01T00:00:00Z",
-            "storage_class": self.storage_class
-        }
-        print(f"⬆️ File uploaded to S3: s3://{self.bucket_name}/{key}")
+        metadata = self._OBJECT_METADATA.copy()
+        metadata["storage_class"] = self.storage_class
+        self.objects[key] = metadata
+        logger.debug("File uploaded to S3: s3://%s/%s", self.bucket_name, key)
     
     def download_file(self, key: str, local_path: str) -> None:
         """Simula la descarga de un archivo desde S3"""
         if key in self.objects:
-            print(f"⬇️ File downloaded from S3: s3://{self.bucket_name}/{key} -> {local_path}")
+            logger.debug("File downloaded from S3: s3://%s/%s -> %s", self.bucket_name, key, local_path)
         else:
             raise FileNotFoundError(f"Object {key} not found in bucket {self.bucket_name}")
 
@@ -201,6 +222,8 @@ class S3Storage(Storage):
 class EC2NetworkInterface(NetworkInterface):
     """Implementación de interfaz de red para EC2"""
     
+    __slots__ = ("instance_id", "security_groups", "public_ip")
+    
     def __init__(self, instance_id: str):
         self.instance_id = instance_id
         self.security_groups: List[str] = []
@@ -208,12 +231,14 @@ class EC2NetworkInterface(NetworkInterface):
     
     def configure_security_group(self, rules: Dict[str, Any]) -> None:
         """Configura security groups"""
-        sg_id = f"sg-{uuid.uuid4().hex[:8]}"
+        sg_id = f"sg-{token_hex(4)}"
         self.security_groups.append(sg_id)
-        print(f"🔒 Security group {sg_id} configured for instance {self.instance_id}")
+        logger.debug("Security group %s configured for instance %s", sg_id, self.instance_id)
     
     def assign_public_ip(self) -> str:
         """Asigna una IP pública elástica"""
-        self.public_ip = f"54.{uuid.uuid4().int % 256}.{uuid.uuid4().int % 256}.{uuid.uuid4().int % 256}"
-        print(f"🌐 Public IP {self.public_ip} assigned to instance {self.instance_id}")
+        # Tres octetos aleatorios de una sola lectura
+        octets = token_bytes(3)
+        self.public_ip = f"54.{octets[0]}.{octets[1]}.{octets[2]}"
+        logger.debug("Public IP %s assigned to instance %s", self.public_ip, self.instance_id)
         return self.public_ip
\ No newline at end of file
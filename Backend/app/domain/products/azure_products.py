@@ -11,6 +11,11 @@ from ..abstractions.products import VirtualMachine, Database, LoadBalancer, Stor
 class AzureVirtualMachine(VirtualMachine):
     """Implementación concreta de VM para Azure"""
     
+    __slots__ = (
+        "vm_size", "image", "resource_group", "network_security_group", "virtual_network",
+        "private_ip", "public_ip"
+    )
+    
     def __init__(self, name: str, region: str, vm_size: str, image: str, resource_group: str):
         super().__init__(f"vm-{uuid.uuid4().hex[:8]}", name, region)
         self.vm_size = vm_size
@@ -70,6 +75,8 @@ class AzureVirtualMachine(VirtualMachine):
 class AzureSQLDatabase(Database):
     """Implementación concreta de Database para Azure (SQL Database)"""
     
+    __slots__ = ("tier", "server_name", "resource_group", "connection_string", "max_size_gb")
+    
     def __init__(self, name: str, region: str, tier: str, server_name: str, resource_group: str):
         super().__init__(f"sqldb-{uuid.uuid4().hex[:8]}", name, region)
         self.tier = tier
@@ -111,6 +118,10 @@ class AzureSQLDatabase(Database):
 class AzureLoadBalancer(LoadBalancer):
     """Implementación concreta de Load Balancer para Azure"""
     
+    __slots__ = (
+        "resource_group", "sku", "backend_pools", "frontend_ip_configs", "public_ip_address"
+    )
+    
     def __init__(self, name: str, region: str, resource_group: str, sku: str = "Standard"):
         super().__init__(f"lb-{uuid.uuid4().hex[:8]}", name, region)
         self.resource_group = resource_group
@@ -158,6 +169,11 @@ class AzureLoadBalancer(LoadBalancer):
 class AzureBlobStorage(Storage):
     """Implementación concreta de Storage para Azure (Blob Storage)"""
     
+    __slots__ = (
+        "storage_account_name", "account_type", "containers", "access_tier",
+        "connection_string"
+    )
+    
     def __init__(self, name: str, region: str, account_type: str = "Standard_LRS"):
         super().__init__(f"blob-{uuid.uuid4().hex[:8]}", name, region)
         self.storage_account_name = name
@@ -207,6 +223,8 @@ class AzureBlobStorage(Storage):
 class AzureNetworkInterface(NetworkInterface):
     """Implementación de interfaz de red para Azure VMs"""
     
+    __slots__ = ("vm_id", "network_security_groups", "public_ip", "virtual_network", "subnet")
+    
     def __init__(self, vm_id: str):
         self.vm_id = vm_id
         self.network_security_groups: List[str] = []
@@ -1,21 +1,23 @@
 
 from __future__ import annotations
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import uuid
-from ..abstractions.products import VirtualMachine, Database, LoadBalancer, Storage, ResourceStatus, NetworkInterface
+from ..abstractions.products import VirtualMachine, Database, LoadBalancer, Storage, ResourceStatus, NetworkInterface, _resource_name
 
 
 class ComputeEngineInstance(VirtualMachine):
     """Implementación concreta de VM para Google Cloud Platform"""
     
-    def __init__(self, config: Dict[str, Any]):
+    __slots__ = ("zone", "machine_type", "boot_disk_size", "project_id")
+    
+    def __init__(self, config: Dict[str, Any], name: Optional[str] = None):
         self.zone = config.get("zone", "us-central1-a")
         self.machine_type = config.get("machine_type", "e2-standard-2")
         self.boot_disk_size = config.get("boot_disk_size", 20)
         self.project_id = config.get("project_id", "my-gcp-project")
         super().__init__(
             resource_id=f"gcp-vm-{uuid.uuid4().hex[:8]}",
-            name=config.get("name", f"gcp-instance-{uuid.uuid4().hex[:6]}"),
+            name=_resource_name(name, config, "gcp-instance"),
             region=self.zone.split('-')[0] + '-' + self.zone.split('-')[1],
         )
         
@@ -52,7 +54,9 @@ class ComputeEngineInstance(VirtualMachine):
 class CloudSQLDatabase(Database):
     """Implementación concreta de base de datos para Google Cloud Platform"""
     
-    def __init__(self, config: Dict[str, Any]):
+    __slots__ = ("engine", "engine_version", "tier", "storage_size")
+    
+    def __init__(self, config: Dict[str, Any], name: Optional[str] = None):
         self.engine = config.get("engine", "postgres")
         self.engine_version = config.get("engine_version", "13")
         self.tier = config.get("tier", "db-standard-1")
@@ -60,7 +64,7 @@ class CloudSQLDatabase(Database):
         self.storage_size = config.get("storage_size", 20)
         super().__init__(
             resource_id=f"gcp-db-{uuid.uuid4().hex[:8]}",
-            name=config.get("name", f"gcp-cloudsql-{uuid.uuid4().hex[:6]}"),
+            name=_resource_name(name, config, "gcp-cloudsql"),
             region=region,
         )
         
@@ -92,13 +96,15 @@ class CloudSQLDatabase(Database):
 class CloudLoadBalancer(LoadBalancer):
     """Implementación concreta de Load Balancer para Google Cloud Platform"""
     
-    def __init__(self, config: Dict[str, Any]):
+    __slots__ = ("load_balancer_type", "backend_services")
+    
+    def __init__(self, config: Dict[str, Any], name: Optional[str] = None):
         self.load_balancer_type = config.get("type", "HTTP(S)")
         region = config.get("region", "us-central1")
         self.backend_services = config.get("backend_services", [])
         super().__init__(
             resource_id=f"gcp-lb-{uuid.uuid4().hex[:8]}",
-            name=config.get("name", f"gcp-lb-{uuid.uuid4().hex[:6]}"),
+            name=_resource_name(name, config, "gcp-lb"),
             region=region,
         )
         
@@ -127,14 +133,16 @@ class CloudLoadBalancer(LoadBalancer):
 class CloudStorage(Storage):
     """Implementación concreta de almacenamiento para Google Cloud Platform"""
     
-    def __init__(self, config: Dict[str, Any]):
+    __slots__ = ("location", "storage_class", "versioning_enabled")
+    
+    def __init__(self, config: Dict[str, Any], name: Optional[str] = None):
         self.location = config.get("location", "US")
         self.storage_class = config.get("storage_class", "STANDARD")
         self.versioning_enabled = config.get("versioning_enabled", False)
         region = self.location if len(self.location) < 6 else "us-central1"
         super().__init__(
             resource_id=f"gcp-storage-{uuid.uuid4().hex[:8]}",
-            name=config.get("name", f"gcp-bucket-{uuid.uuid4().hex[:6]}"),
+            name=_resource_name(name, config, "gcp-bucket"),
             region=region,
         )
         
@@ -11,6 +11,11 @@ from ..abstractions.products import VirtualMachine, Database, LoadBalancer, Stor
 class OnPremiseVirtualMachine(VirtualMachine):
     """Implementación concreta de VM para infraestructura on-premise"""
     
+    __slots__ = (
+        "cpu_cores", "ram_gb", "disk_gb", "hypervisor", "network_interface", "host_server",
+        "datastore"
+    )
+    
     def __init__(self, config: Dict[str, Any]):
         region = config.get("region", "datacenter-1")
         super().__init__(
@@ -79,6 +84,8 @@ class OnPremiseVirtualMachine(VirtualMachine):
 class OnPremiseDatabase(Database):
     """Implementación concreta de base de datos para infraestructura on-premise"""
     
+    __slots__ = ("engine", "version", "port", "host_server", "data_directory", "max_connections")
+    
     def __init__(self, config: Dict[str, Any]):
         region = config.get("region", "datacenter-1")
         super().__init__(
@@ -138,6 +145,10 @@ class OnPremiseDatabase(Database):
 class OnPremiseLoadBalancer(LoadBalancer):
     """Implementación concreta de Load Balancer para infraestructura on-premise"""
     
+    __slots__ = (
+        "load_balancer_type", "listen_port", "algorithm", "host_server", "backend_servers"
+    )
+    
     def __init__(self, config: Dict[str, Any]):
         region = config.get("region", "datacenter-1")
         super().__init__(
@@ -195,6 +206,11 @@ class OnPremiseLoadBalancer(LoadBalancer):
 class OnPremiseStorage(Storage):
     """Implementación concreta de almacenamiento para infraestructura on-premise"""
     
+    __slots__ = (
+        "storage_type", "mount_point", "capacity_gb", "host_server", "protocol_version",
+        "access_permissions"
+    )
+    
     def __init__(self, config: Dict[str, Any]):
         region = config.get("region", "datacenter-1")
         super().__init__(
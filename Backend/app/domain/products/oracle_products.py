@@ -3,19 +3,21 @@ Productos concretos de Oracle Cloud para el patrón Abstract Factory.
 Estos implementan las interfaces abstractas para los servicios específicos de Oracle Cloud Infrastructure (OCI).
 """
 from __future__ import annotations
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import uuid
-from ..abstractions.products import VirtualMachine, Database, LoadBalancer, Storage, ResourceStatus, NetworkInterface
+from ..abstractions.products import VirtualMachine, Database, LoadBalancer, Storage, ResourceStatus, NetworkInterface, _resource_name
 
 
 class OracleComputeInstance(VirtualMachine):
     """Implementación concreta de VM para Oracle Cloud Infrastructure"""
     
-    def __init__(self, config: Dict[str, Any]):
+    __slots__ = ("compute_shape", "availability_domain", "compartment_id", "subnet_id", "image_id")
+    
+    def __init__(self, config: Dict[str, Any], name: Optional[str] = None):
         region = config.get("region", "us-ashburn-1")
         super().__init__(
             resource_id=f"oci-vm-{uuid.uuid4().hex[:8]}",
-            name=config.get("name", f"oci-instance-{uuid.uuid4().hex[:6]}"),
+            name=_resource_name(name, config, "oci-instance"),
             region=region
         )
         self.compute_shape = config.get("compute_shape", "VM.Standard2.1")
@@ -70,11 +72,13 @@ class OracleComputeInstance(VirtualMachine):
 class OracleAutonomousDatabase(Database):
     """Implementación concreta de base de datos para Oracle Cloud Infrastructure"""
     
-    def __init__(self, config: Dict[str, Any]):
+    __slots__ = ("workload_type", "cpu_count", "storage_tb", "compartment_id", "admin_password")
+    
+    def __init__(self, config: Dict[str, Any], name: Optional[str] = None):
         region = config.get("region", "us-ashburn-1")
         super().__init__(
             resource_id=f"oci-db-{uuid.uuid4().hex[:8]}",
-            name=config.get("name", f"oci-adb-{uuid.uuid4().hex[:6]}"),
+            name=_resource_name(name, config, "oci-adb"),
             region=region
         )
         self.workload_type = config.get("workload_type", "OLTP")  # OLTP, DW, AJD, APEX
@@ -122,11 +126,13 @@ class OracleAutonomousDatabase(Database):
 class OracleLoadBalancer(LoadBalancer):
     """Implementación concreta de Load Balancer para Oracle Cloud Infrastructure"""
     
-    def __init__(self, config: Dict[str, Any]):
+    __slots__ = ("shape", "compartment_id", "subnet_ids", "backend_sets")
+    
+    def __init__(self, config: Dict[str, Any], name: Optional[str] = None):
         region = config.get("region", "us-ashburn-1")
         super().__init__(
             resource_id=f"oci-lb-{uuid.uuid4().hex[:8]}",
-            name=config.get("name", f"oci-lb-{uuid.uuid4().hex[:6]}"),
+            name=_resource_name(name, config, "oci-lb"),
             region=region
         )
         self.shape = config.get("shape", "100Mbps")  # 10Mbps, 100Mbps, 400Mbps, 8000Mbps
@@ -175,11 +181,13 @@ class OracleLoadBalancer(LoadBalancer):
 class OracleObjectStorage(Storage):
     """Implementación concreta de almacenamiento para Oracle Cloud Infrastructure"""
     
-    def __init__(self, config: Dict[str, Any]):
+    __slots__ = ("namespace", "compartment_id", "storage_tier", "versioning_enabled")
+    
+    def __init__(self, config: Dict[str, Any], name: Optional[str] = None):
         region = config.get("region", "us-ashburn-1")
         super().__init__(
             resource_id=f"oci-storage-{uuid.uuid4().hex[:8]}",
-            name=config.get("name", f"oci-bucket-{uuid.uuid4().hex[:6]}"),
+            name=_resource_name(name, config, "oci-bucket"),
             region=region
         )
         self.namespace = config.get("namespace", "my-namespace")
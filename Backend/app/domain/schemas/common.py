@@ -40,4 +40,7 @@ class VMResponse(BaseModel):
 
 
 class VMListResponse(BaseModel):
+    total: int
     items: List[VMDTO]
+    page: int
+    page_size: int
@@ -1,4 +1,4 @@
-from typing import Optional, Union, Literal
+from typing import Annotated, Optional, Union, Literal
 from pydantic import BaseModel, Field
 from .common import ProviderEnum
 from .aws import AWSParams
@@ -34,4 +34,9 @@ class VMCreateOracle(VMCreateBase):
     provider: Literal[ProviderEnum.oracle]
     params: OracleParams
 
-VMCreateRequest = Union[VMCreateAWS, VMCreateAzure, VMCreateGCP, VMCreateOnPrem, VMCreateOracle]
+# Unión discriminada por `provider`: Pydantic elige el modelo por el valor del
+# campo en lugar de probar cada variante hasta que una valide
+VMCreateRequest = Annotated[
+    Union[VMCreateAWS, VMCreateAzure, VMCreateGCP, VMCreateOnPrem, VMCreateOracle],
+    Field(discriminator="provider")
+]
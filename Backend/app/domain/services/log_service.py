@@ -1,88 +1,137 @@
 import json
+import logging
 import os
-from typing import List, Optional
+import sys
+import threading
+from typing import Dict, Iterable, List, Optional
 from app.domain.schemas.logs import AuditLogEntry, LogsQuery
 
+logger = logging.getLogger(__name__)
+
+# Campos de texto filtrables (coincidencia parcial, sin distinguir mayúsculas)
+_TEXT_FILTERS = ("actor", "action", "provider", "vm_id")
+# Campos con pocos valores distintos que se repiten en casi todas las líneas:
+# se internan para que todas las entradas y las claves de los índices compartan
+# el mismo objeto en lugar de una copia por línea
+_INTERNED_FIELDS = ("actor", "action", "provider")
+
 
 class LogService:
+    """
+    Consulta los logs de auditoría a partir de un índice en memoria.
+    El fichero se lee de forma incremental (solo las líneas nuevas desde la
+    última consulta) y cada entrada se indexa por actor, acción, proveedor,
+    vm_id y éxito. Un filtro recorre los valores distintos del campo, no todas
+    las entradas.
+    """
+
     def __init__(self):
         # Ruta absoluta al archivo de logs
         project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
         self.log_file_path = os.path.join(project_root, "logs", "audit.log")
-        print(f"🔍 LogService - Ruta del archivo: {self.log_file_path}")
-        print(f"📁 Existe archivo: {os.path.exists(self.log_file_path)}")
+        logger.debug("LogService - Ruta del archivo: %s", self.log_file_path)
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._offset = 0
+        self._line_count = 0
+        self._entries: List[AuditLogEntry] = []
+        # campo -> valor tal cual aparece en el log -> posiciones en _entries
+        self._indexes: Dict[str, Dict[str, List[int]]] = {field: {} for field in _TEXT_FILTERS}
+        self._by_success: Dict[bool, List[int]] = {True: [], False: []}
+
+    def _refresh(self) -> bool:
+        """Incorpora las líneas completas añadidas al fichero. False si no existe"""
+        try:
+            size = os.path.getsize(self.log_file_path)
+        except OSError:
+            return False
+        if size < self._offset:
+            # Fichero truncado o rotado: se reconstruye el índice
+            self._reset()
+        if size == self._offset:
+            return True
+        with open(self.log_file_path, "rb") as file:
+            file.seek(self._offset)
+            chunk = file.read(size - self._offset)
+        # Una línea sin salto final puede estar a medio escribir: se deja para la próxima
+        complete = chunk[:chunk.rfind(b"\n") + 1]
+        self._offset += len(complete)
+        self._ingest(complete.decode("utf-8").splitlines())
+        return True
+
+    def _ingest(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            self._line_count += 1
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+                for field in _INTERNED_FIELDS:
+                    value = record.get(field)
+                    if type(value) is str:
+                        record[field] = sys.intern(value)
+                entry = AuditLogEntry(**record)
+            except json.JSONDecodeError as e:
+                logger.debug("Error JSON en línea %d: %s", self._line_count, e)
+                continue  # Skip malformed lines
+            except Exception as e:
+                logger.debug("Error creando AuditLogEntry en línea %d: %s", self._line_count, e)
+                continue
+            position = len(self._entries)
+            self._entries.append(entry)
+            for field in _TEXT_FILTERS:
+                self._indexes[field].setdefault(getattr(entry, field), []).append(position)
+            self._by_success[entry.success].append(position)
+        logger.debug("Indexados %d logs de %d líneas", len(self._entries), self._line_count)
 
     def get_logs(self, query: LogsQuery) -> tuple[List[AuditLogEntry], int]:
         """
         Obtiene logs con filtros y paginación.
         Retorna (logs_filtrados, total_count)
         """
-        if not os.path.exists(self.log_file_path):
-            print(f"❌ Archivo no encontrado: {self.log_file_path}")
-            return [], 0
-
-        all_logs = []
-        line_count = 0
-        
-        try:
-            with open(self.log_file_path, 'r', encoding='utf-8') as file:
-                for line in file:
-                    line_count += 1
-                    line = line.strip()
-                    if line:
-                        try:
-                            log_data = json.loads(line)
-                            all_logs.append(AuditLogEntry(**log_data))
-                        except json.JSONDecodeError as e:
-                            print(f"❌ Error JSON en línea {line_count}: {e}")
-                            continue  # Skip malformed lines
-                        except Exception as e:
-                            print(f"❌ Error creando AuditLogEntry en línea {line_count}: {e}")
-                            continue
-            
-            print(f"✅ Cargados {len(all_logs)} logs de {line_count} líneas")
-            
-        except FileNotFoundError:
-            print(f"❌ Archivo no encontrado: {self.log_file_path}")
-            return [], 0
-        except Exception as e:
-            print(f"❌ Error leyendo archivo: {e}")
-            return [], 0
+        with self._lock:
+            if not self._refresh():
+                logger.warning("Archivo no encontrado: %s", self.log_file_path)
+                return [], 0
+            positions = self._matching_positions(query)
+            if positions is None:
+                filtered_logs = list(self._entries)
+            else:
+                filtered_logs = [self._entries[i] for i in sorted(positions)]
 
-        # Aplicar filtros
-        filtered_logs = self._apply_filters(all_logs, query)
-        
         # Ordenar por timestamp (más recientes primero)
         filtered_logs.sort(key=lambda x: x.timestamp, reverse=True)
-        
+
         # Aplicar paginación
         total = len(filtered_logs)
         start_idx = (query.page - 1) * query.page_size
         end_idx = start_idx + query.page_size
         paginated_logs = filtered_logs[start_idx:end_idx]
-        
+
         return paginated_logs, total
 
-    def _apply_filters(self, logs: List[AuditLogEntry], query: LogsQuery) -> List[AuditLogEntry]:
-        """Aplica filtros a la lista de logs"""
-        filtered = logs
-        
-        if query.actor:
-            filtered = [log for log in filtered if query.actor.lower() in log.actor.lower()]
-        
-        if query.action:
-            filtered = [log for log in filtered if query.action.lower() in log.action.lower()]
-        
-        if query.provider:
-            filtered = [log for log in filtered if query.provider.lower() in log.provider.lower()]
-        
+    def _matching_positions(self, query: LogsQuery) -> Optional[set]:
+        """Intersección de los índices de cada filtro; None si no hay filtros"""
+        candidate_sets = []
+        for field in _TEXT_FILTERS:
+            needle = getattr(query, field)
+            if needle:
+                needle = needle.lower()
+                matched = set()
+                for value, positions in self._indexes[field].items():
+                    if needle in value.lower():
+                        matched.update(positions)
+                candidate_sets.append(matched)
         if query.success is not None:
-            filtered = [log for log in filtered if log.success == query.success]
-        
-        if query.vm_id:
-            filtered = [log for log in filtered if query.vm_id.lower() in log.vm_id.lower()]
-        
-        return filtered
+            candidate_sets.append(set(self._by_success[query.success]))
+        if not candidate_sets:
+            return None
+        # Empezar por el conjunto más pequeño abarata la intersección
+        candidate_sets.sort(key=len)
+        return candidate_sets[0].intersection(*candidate_sets[1:])
 
     def get_recent_logs(self, limit: int = 100) -> List[AuditLogEntry]:
         """Obtiene los logs más recientes (para dashboard)"""
@@ -91,48 +140,22 @@ class LogService:
         return logs
 
     def get_stats(self) -> dict:
-        """Obtiene estadísticas básicas de logs"""
-        if not os.path.exists(self.log_file_path):
+        """Obtiene estadísticas básicas de logs (contadas sobre los índices)"""
+        with self._lock:
+            if not self._refresh():
+                return {
+                    "total_operations": 0,
+                    "successful_operations": 0,
+                    "failed_operations": 0,
+                    "providers": {},
+                    "actions": {}
+                }
+            total = len(self._entries)
+            successful = len(self._by_success[True])
             return {
-                "total_operations": 0,
-                "successful_operations": 0,
-                "failed_operations": 0,
-                "providers": {},
-                "actions": {}
+                "total_operations": total,
+                "successful_operations": successful,
+                "failed_operations": total - successful,
+                "providers": {provider: len(positions) for provider, positions in self._indexes["provider"].items()},
+                "actions": {action: len(positions) for action, positions in self._indexes["action"].items()}
             }
-
-        all_logs = []
-        try:
-            with open(self.log_file_path, 'r', encoding='utf-8') as file:
-                for line in file:
-                    line = line.strip()
-                    if line:
-                        try:
-                            log_data = json.loads(line)
-                            all_logs.append(AuditLogEntry(**log_data))
-                        except json.JSONDecodeError:
-                            continue
-        except FileNotFoundError:
-            pass
-
-        total = len(all_logs)
-        successful = len([log for log in all_logs if log.success])
-        failed = total - successful
-
-        # Contar por proveedor
-        providers = {}
-        for log in all_logs:
-            providers[log.provider] = providers.get(log.provider, 0) + 1
-
-        # Contar por acción
-        actions = {}
-        for log in all_logs:
-            actions[log.action] = actions.get(log.action, 0) + 1
-
-        return {
-            "total_operations": total,
-            "successful_operations": successful,
-            "failed_operations": failed,
-            "providers": providers,
-            "actions": actions
-        }
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import List, Dict, Any
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 from datetime import datetime
 from app.domain.schemas import (
     VMCreateRequest,
@@ -8,20 +8,26 @@ from app.domain.schemas import (
     ProviderEnum
 )
 from app.domain.ports import VMRepositoryPort
-from app.domain.factory_provider import create_cloud_factory, CloudProvider
+from app.domain.factory_provider import get_cloud_factory
 from app.domain.abstractions.factory import CloudResourceManager
-from app.infrastructure.logger import audit_log
+from app.infrastructure.logger import audit_queue
 
 
 class VMService:
+    # acción -> (métodos a invocar sobre la VM, estado resultante)
+    _ACTIONS: ClassVar[Dict[str, Tuple[Tuple[str, ...], str]]] = {
+        "start": (("start",), "running"),
+        "stop": (("stop",), "stopped"),
+        "restart": (("stop", "start"), "running"),
+    }
+
     def __init__(self, repo: VMRepositoryPort):
         self.repo = repo
 
     def create_vm(self, data: VMCreateRequest) -> VMDTO:
         # Usar el nuevo Abstract Factory
         try:
-            provider = CloudProvider(data.provider)
-            abstract_factory = create_cloud_factory(provider)
+            abstract_factory = get_cloud_factory(data.provider)
             
             # Crear VM usando Abstract Factory
             vm_config = data.params.model_dump()
@@ -38,7 +44,7 @@ class VMService:
             )
             
             self.repo.save(vm)
-            audit_log(
+            audit_queue.submit(
                 actor=data.requested_by or "system",
                 action="create",
                 vm_id=vm.id,
@@ -48,7 +54,7 @@ class VMService:
             )
             return vm
         except Exception as e:
-            audit_log(
+            audit_queue.submit(
                 actor=data.requested_by or "system",
                 action="create",
                 vm_id="",
@@ -75,7 +81,7 @@ class VMService:
         """
         try:
             # Obtener la factory usando el nuevo patrón Abstract Factory
-            cloud_factory = create_cloud_factory(provider_name)
+            cloud_factory = get_cloud_factory(provider_name)
             
             # Crear el resource manager con la factory
             resource_manager = CloudResourceManager(cloud_factory)
@@ -84,7 +90,7 @@ class VMService:
             infrastructure = resource_manager.create_infrastructure(infrastructure_config)
             
             # Log de la operación exitosa
-            audit_log(
+            audit_queue.submit(
                 actor=infrastructure_config.get("requested_by", "system"),
                 action="create_infrastructure",
                 vm_id="multiple",
@@ -104,7 +110,7 @@ class VMService:
             }
             
         except Exception as e:
-            audit_log(
+            audit_queue.submit(
                 actor=infrastructure_config.get("requested_by", "system"),
                 action="create_infrastructure",
                 vm_id="multiple",
@@ -117,8 +123,7 @@ class VMService:
     def update_vm(self, vm_id: str, changes: VMUpdateRequest) -> VMDTO:
         vm = self.repo.get(vm_id)
         try:
-            provider = CloudProvider(vm.provider)
-            abstract_factory = create_cloud_factory(provider)
+            abstract_factory = get_cloud_factory(vm.provider)
             
             # Para actualizar, necesitamos obtener la VM desde el Abstract Factory
             # y luego aplicar los cambios
@@ -134,7 +139,7 @@ class VMService:
             virtual_machine.resize(vm_config.get('params', {}).get('instance_type', vm.params.get('instance_type')))
             
             self.repo.save(vm)
-            audit_log(
+            audit_queue.submit(
                 actor="system",
                 action="update",
                 vm_id=vm.id,
@@ -144,7 +149,7 @@ class VMService:
             )
             return vm
         except Exception as e:
-            audit_log(
+            audit_queue.submit(
                 actor="system",
                 action="update",
                 vm_id=vm_id,
@@ -157,15 +162,14 @@ class VMService:
     def delete_vm(self, vm_id: str) -> None:
         vm = self.repo.get(vm_id)
         try:
-            provider = CloudProvider(vm.provider)
-            abstract_factory = create_cloud_factory(provider)
+            abstract_factory = get_cloud_factory(vm.provider)
             
             # Simular eliminación usando Abstract Factory
             virtual_machine = abstract_factory.create_virtual_machine(vm.params)
             virtual_machine.stop()  # Detener antes de eliminar
             
             self.repo.delete(vm_id)
-            audit_log(
+            audit_queue.submit(
                 actor="system",
                 action="delete",
                 vm_id=vm.id,
@@ -174,7 +178,7 @@ class VMService:
                 details=None,
             )
         except Exception as e:
-            audit_log(
+            audit_queue.submit(
                 actor="system",
                 action="delete",
                 vm_id=vm_id,
@@ -187,26 +191,22 @@ class VMService:
     def apply_action(self, vm_id: str, action_req: VMActionRequest) -> VMDTO:
         vm = self.repo.get(vm_id)
         try:
-            provider = CloudProvider(vm.provider)
-            abstract_factory = create_cloud_factory(provider)
+            abstract_factory = get_cloud_factory(vm.provider)
             
             # Crear la VM para aplicar acciones
             virtual_machine = abstract_factory.create_virtual_machine(vm.params)
             
             # Aplicar la acción
-            if action_req.action == "start":
-                virtual_machine.start()
-                vm.status = "running"
-            elif action_req.action == "stop":
-                virtual_machine.stop()
-                vm.status = "stopped"
-            elif action_req.action == "restart":
-                virtual_machine.stop()
-                virtual_machine.start()
-                vm.status = "running"
+            try:
+                steps, status = self._ACTIONS[action_req.action]
+            except KeyError:
+                raise ValueError(f"Invalid action: {action_req.action}") from None
+            for step in steps:
+                getattr(virtual_machine, step)()
+            vm.status = status
             
             self.repo.save(vm)
-            audit_log(
+            audit_queue.submit(
                 actor=action_req.requested_by or "system",
                 action=action_req.action,
                 vm_id=vm.id,
@@ -216,7 +216,7 @@ class VMService:
             )
             return vm
         except Exception as e:
-            audit_log(
+            audit_queue.submit(
                 actor=action_req.requested_by or "system",
                 action=action_req.action,
                 vm_id=vm_id,
@@ -229,5 +229,16 @@ class VMService:
     def get_vm(self, vm_id: str) -> VMDTO:
         return self.repo.get(vm_id)
 
+    def get_vm_version(self, vm_id: str) -> int:
+        return self.repo.version(vm_id)
+
+    def list_revision(self) -> int:
+        return self.repo.revision
+
     def list_vms(self) -> List[VMDTO]:
-        return self.repo.list()
\ No newline at end of file
+        return self.repo.list()
+
+    def list_vms_page(
+        self, offset: int, limit: int, provider: Optional[str] = None, status: Optional[str] = None
+    ) -> Tuple[List[VMDTO], int]:
+        return self.repo.list_page(offset, limit, provider, status)
@@ -1,7 +1,11 @@
+import asyncio
 import logging
+import logging.handlers
 import json
 import os
-from datetime import datetime
+import queue
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
 
 LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "logs"))
 os.makedirs(LOG_DIR, exist_ok=True)
@@ -16,9 +20,39 @@ if not logger.handlers:
     logger.addHandler(fh)
 
 
-def audit_log(actor: str, action: str, vm_id: str, provider: str, success: bool, details=None):
-    payload = {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+# Logs de diagnóstico de la aplicación (logger "app"): los handlers solo encolan
+# el registro y un QueueListener hace la escritura en un hilo aparte.
+app_logger = logging.getLogger("app")
+_app_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_app_queue_handler = logging.handlers.QueueHandler(_app_log_queue)
+_app_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def start_app_logging(level: str = "INFO") -> None:
+    global _app_listener
+    if _app_listener is not None:
+        return
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    _app_listener = logging.handlers.QueueListener(_app_log_queue, stream, respect_handler_level=True)
+    _app_listener.start()
+    app_logger.setLevel(level)
+    app_logger.addHandler(_app_queue_handler)
+
+
+def stop_app_logging() -> None:
+    """Desconecta el handler y vacía los registros pendientes"""
+    global _app_listener
+    if _app_listener is None:
+        return
+    app_logger.removeHandler(_app_queue_handler)
+    _app_listener.stop()
+    _app_listener = None
+
+
+def _build_payload(actor: str, action: str, vm_id: str, provider: str, success: bool, details=None) -> Dict[str, Any]:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
         "actor": actor,
         "action": action,
         "vm_id": vm_id,
@@ -26,5 +60,122 @@ def audit_log(actor: str, action: str, vm_id: str, provider: str, success: bool,
         "success": success,
         "details": details,
     }
+
+
+def audit_log(actor: str, action: str, vm_id: str, provider: str, success: bool, details=None):
+    payload = _build_payload(actor, action, vm_id, provider, success, details)
     # evitar credenciales sensibles: nunca registramos 'params' completos ni secretos
     logger.info(json.dumps(payload))
+
+
+def audit_log_many(events: Iterable[Dict[str, Any]]) -> None:
+    """Escribe varios eventos ya construidos en una sola llamada al handler (una línea por evento)"""
+    lines = "\n".join(json.dumps(event) for event in events)
+    if lines:
+        logger.info(lines)
+
+
+# Marca de parada: el consumidor vuelca su lote y termina al recibirla
+_STOP = object()
+
+# Tamaño máximo de lote y ventana de espera desde el primer evento del lote
+AUDIT_BUFFER_SIZE = 512
+AUDIT_FLUSH_INTERVAL_MS = 100
+
+
+class AuditLogQueue:
+    """
+    Cola asíncrona de auditoría: los handlers encolan eventos sin bloquear y una
+    tarea en segundo plano los vuelca por lotes con audit_log_many. Un lote se
+    escribe al llegar a batch_size eventos o al pasar flush_interval segundos
+    desde el primero, lo que ocurra antes.
+    Si la cola no está arrancada (p. ej. fuera del lifespan de la app) se
+    escribe de forma síncrona. Si está llena el evento se descarta y se cuenta
+    en `dropped`: la petición nunca espera al disco.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = AUDIT_BUFFER_SIZE,
+        flush_interval: float = AUDIT_FLUSH_INTERVAL_MS / 1000,
+        maxsize: int = 10_000
+    ):
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._maxsize = maxsize
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self.dropped = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def submit(self, actor: str, action: str, vm_id: str, provider: str, success: bool, details=None) -> None:
+        # El timestamp se fija al encolar, no al escribir
+        payload = _build_payload(actor, action, vm_id, provider, success, details)
+        if not self.running:
+            audit_log_many((payload,))
+            return
+        try:
+            self._queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            app_logger.warning("Cola de auditoría llena: evento descartado (%d en total)", self.dropped)
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self._maxsize)
+        self._task = asyncio.create_task(self._consume())
+
+    async def stop(self) -> None:
+        """Detiene el consumidor y vuelca los eventos pendientes"""
+        if self._task is None:
+            return
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+        # Eventos encolados mientras el consumidor terminaba
+        leftovers = self._drain_rest()
+        if leftovers:
+            audit_log_many(leftovers)
+
+    def _drain_rest(self) -> List[Dict[str, Any]]:
+        batch: List[Dict[str, Any]] = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not _STOP:
+                batch.append(item)
+        return batch
+
+    async def _consume(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            first = await self._queue.get()
+            if first is _STOP:
+                return
+            batch = [first]
+            stopping = False
+            deadline = loop.time() + self._flush_interval
+            while len(batch) < self._batch_size:
+                if not self._queue.empty():
+                    item = self._queue.get_nowait()
+                else:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            await asyncio.to_thread(audit_log_many, batch)
+            if stopping:
+                return
+
+
+audit_queue = AuditLogQueue()
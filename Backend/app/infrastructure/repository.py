@@ -1,28 +1,90 @@
 from __future__ import annotations
-from typing import List, Dict
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
 from app.domain.schemas import VMDTO
-from app.domain.ports import VMRepositoryPort
+from app.domain.ports import VMNotFoundError, VMRepositoryPort
 
 
 class VMRepository(VMRepositoryPort):
-    """Repositorio en memoria (dict) para simular persistencia sin BD."""
+    """
+    Repositorio en memoria (dict) para simular persistencia sin BD.
+    Mantiene índices secundarios por proveedor y por estado (id -> VM, en orden
+    de inserción) para que los listados filtrados recorran solo los resultados.
+    """
 
     def __init__(self):
         self._store: Dict[str, VMDTO] = {}
+        self._by_provider: Dict[str, Dict[str, VMDTO]] = {}
+        self._by_status: Dict[str, Dict[str, VMDTO]] = {}
+        # (proveedor, estado) con los que se indexó cada VM: el DTO puede
+        # modificarse en sitio antes de volver a guardarse
+        self._indexed: Dict[str, Tuple[str, str]] = {}
+        # Revisión global y revisión del último guardado de cada VM (para ETags)
+        self._revision = 0
+        self._versions: Dict[str, int] = {}
 
     def save(self, vm: VMDTO) -> None:
+        self._unindex(vm.id)
         self._store[vm.id] = vm
+        key = (vm.provider.value, vm.status)
+        self._by_provider.setdefault(key[0], {})[vm.id] = vm
+        self._by_status.setdefault(key[1], {})[vm.id] = vm
+        self._indexed[vm.id] = key
+        self._revision += 1
+        self._versions[vm.id] = self._revision
 
     def get(self, vm_id: str) -> VMDTO:
         vm = self._store.get(vm_id)
         if not vm:
-            raise KeyError("VM not found")
+            raise VMNotFoundError("VM not found")
         return vm
 
     def delete(self, vm_id: str) -> None:
         if vm_id not in self._store:
-            raise KeyError("VM not found")
+            raise VMNotFoundError("VM not found")
+        self._unindex(vm_id)
         del self._store[vm_id]
+        del self._versions[vm_id]
+        self._revision += 1
+
+    def version(self, vm_id: str) -> int:
+        try:
+            return self._versions[vm_id]
+        except KeyError:
+            raise VMNotFoundError("VM not found") from None
+
+    @property
+    def revision(self) -> int:
+        return self._revision
 
     def list(self) -> List[VMDTO]:
         return list(self._store.values())
+
+    def list_page(
+        self, offset: int, limit: int, provider: Optional[str] = None, status: Optional[str] = None
+    ) -> Tuple[List[VMDTO], int]:
+        bucket = self._bucket(provider, status)
+        if provider is not None and status is not None:
+            # Se recorre el índice más pequeño comprobando el otro criterio
+            by_status = self._by_status.get(status, {})
+            if len(by_status) < len(bucket):
+                bucket = by_status
+            matches = [vm for vm in bucket.values() if vm.provider.value == provider and vm.status == status]
+            return matches[offset:offset + limit], len(matches)
+        # islice evita copiar todas las VMs para quedarse con una página
+        return list(islice(bucket.values(), offset, offset + limit)), len(bucket)
+
+    def _bucket(self, provider: Optional[str], status: Optional[str]) -> Dict[str, VMDTO]:
+        if provider is not None:
+            return self._by_provider.get(provider, {})
+        if status is not None:
+            return self._by_status.get(status, {})
+        return self._store
+
+    def _unindex(self, vm_id: str) -> None:
+        key = self._indexed.pop(vm_id, None)
+        if key is None:
+            return
+        provider, status = key
+        self._by_provider[provider].pop(vm_id, None)
+        self._by_status[status].pop(vm_id, None)
@@ -1,14 +1,52 @@
-from fastapi import FastAPI
+import logging
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from app.api.vm_controller import router as vm_router
 from app.api.logs_controller import router as logs_router
 from app.api.abstract_factory_controller import router as abstract_factory_router
+from app.core.config import LOG_LEVEL
+from app.infrastructure.logger import audit_queue, start_app_logging, stop_app_logging
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Logs de diagnóstico escritos desde un hilo (QueueHandler/QueueListener)
+    start_app_logging(LOG_LEVEL)
+    # Consumidor de la cola de auditoría (escrituras por lotes)
+    await audit_queue.start()
+    # FastAPI genera el OpenAPI (esquemas de todos los modelos) de forma perezosa
+    # en la primera petición a /openapi.json; se construye y cachea al arrancar
+    app.openapi()
+    yield
+    await audit_queue.stop()
+    stop_app_logging()
+
 
 app = FastAPI(
     title="VM Abstract Factory API", 
     version="2.0.0",
-    description="API que implementa el patrón Abstract Factory para gestión completa de infraestructura cloud"
+    description="API que implementa el patrón Abstract Factory para gestión completa de infraestructura cloud",
+    lifespan=lifespan,
+    # Serialización JSON con orjson en todos los endpoints
+    default_response_class=ORJSONResponse
 )
 
+logger = logging.getLogger(__name__)
+
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    # Punto único para errores no previstos: los controladores solo capturan
+    # las excepciones de dominio que saben traducir
+    logger.exception("Error no controlado en %s %s", request.method, request.url.path)
+    return ORJSONResponse(status_code=500, content={"detail": "Error interno del servidor"})
+
+
+# Compresión de respuestas grandes (listado, ejemplos); las pequeñas se envían tal cual
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Rutas principales - Abstract Factory Pattern
 app.include_router(abstract_factory_router, prefix="/cloud", tags=["abstract-factory"])
 